@@ -0,0 +1,248 @@
+"""Persistent HTTP response cache for forge API clients."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path("~/.cache/git-year-end-report").expanduser()
+
+
+class ResponseCache:
+    """Disk-backed cache of API responses used for conditional requests.
+
+    Each response body is stored alongside its ETag, Last-Modified and Link
+    headers in a JSON file named after a SHA-256 hash of the request URL,
+    query parameters and a fingerprint of the API token, so responses
+    fetched with one token are never served to a run using another (or
+    none). Callers send the stored validators back to the server
+    and reuse the stored body when it answers 304 Not Modified. Responses
+    stored with a max_age, such as queries over a date range that has
+    already ended, are reused without asking the server at all until it has
+    passed.
+
+    The least recently used entries beyond max_entries are evicted after
+    every evict_interval writes, so the directory is not scanned on each
+    write. Async callers use aget() and aset(), which run the file I/O in a
+    worker thread instead of blocking the event loop. Cache failures are
+    logged and otherwise ignored so that an unwritable cache directory
+    never breaks a report.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        token: str | None = None,
+        max_entries: int = 4096,
+        evict_interval: int = 256,
+    ):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory where cache entries are stored
+            token: API token the cached responses are fetched with, if any
+            max_entries: Maximum number of entries to keep
+            evict_interval: Number of writes between eviction passes
+        """
+        self.directory = directory
+        # Only a prefix of the token's hash goes into the keys
+        self._token_key = (
+            hashlib.sha256(token.encode()).hexdigest()[:16] if token else ""
+        )
+        self.max_entries = max_entries
+        self.evict_interval = evict_interval
+        self._writes_since_evict = 0
+        self._lock = threading.Lock()
+
+    def _path(self, url: str, params: dict | None) -> Path:
+        """Return the file path for a request.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Path of the cache entry
+        """
+        key = repr((self._token_key, url, tuple(sorted((params or {}).items()))))
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def get(self, url: str, params: dict | None) -> dict | None:
+        """Look up a cached response.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Cache entry with "etag", "last_modified", "link", "expires"
+            and "body" keys, or None if the request has not been
+            cached
+        """
+        path = self._path(url, params)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+            # Touch the entry so eviction keeps recently used responses
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Cache: Ignoring unreadable entry {path}: {e}")
+            return None
+
+        return entry
+
+    async def aget(self, url: str, params: dict | None) -> dict | None:
+        """Look up a cached response without blocking the event loop.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Cache entry as returned by get(), or None
+        """
+        return await asyncio.to_thread(self.get, url, params)
+
+    @staticmethod
+    def is_fresh(entry: dict | None) -> bool:
+        """Check whether a cache entry can be reused without revalidation.
+
+        Args:
+            entry: Cache entry returned by get(), or None
+
+        Returns:
+            True if the entry's max_age has not passed
+        """
+        if not entry:
+            return False
+        return (entry.get("expires") or 0) > time.time()
+
+    @staticmethod
+    def conditional_headers(entry: dict | None) -> dict:
+        """Build revalidation headers for a cache entry.
+
+        Args:
+            entry: Cache entry returned by get(), or None
+
+        Returns:
+            Headers to send with the request
+        """
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def set(
+        self,
+        url: str,
+        params: dict | None,
+        response: httpx.Response,
+        body,
+        max_age: float | None = None,
+    ) -> None:
+        """Store a response.
+
+        Responses without an ETag or Last-Modified header cannot be
+        revalidated and are only stored if they have a max_age.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            response: Response to store the headers of
+            body: Decoded JSON body of the response
+            max_age: Seconds for which the response can be reused without
+                revalidation
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified and not max_age:
+            return
+
+        entry = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "link": response.headers.get("Link", ""),
+            "expires": time.time() + max_age if max_age else None,
+            "body": body,
+        }
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write atomically so concurrent runs never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, self._path(url, params))
+            except BaseException:
+                # Do not leave a partial temporary file behind
+                try:
+                    os.unlink(tmp_path)
+                except FileNotFoundError:
+                    pass
+                raise
+        except OSError as e:
+            logger.debug(f"Cache: Failed to store response for {url}: {e}")
+            return
+
+        with self._lock:
+            self._writes_since_evict += 1
+            if self._writes_since_evict < self.evict_interval:
+                return
+            self._writes_since_evict = 0
+
+        try:
+            self._evict()
+        except OSError as e:
+            logger.debug(f"Cache: Failed to evict old entries: {e}")
+
+    async def aset(
+        self,
+        url: str,
+        params: dict | None,
+        response: httpx.Response,
+        body,
+        max_age: float | None = None,
+    ) -> None:
+        """Store a response without blocking the event loop.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            response: Response to store the headers of
+            body: Decoded JSON body of the response
+            max_age: Seconds for which the response can be reused without
+                revalidation
+        """
+        await asyncio.to_thread(self.set, url, params, response, body, max_age)
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries beyond max_entries."""
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                # Removed by a concurrent run
+                continue
+
+        if len(entries) <= self.max_entries:
+            return
+
+        entries.sort()
+        for _, path in entries[: len(entries) - self.max_entries]:
+            path.unlink(missing_ok=True)
@@ -1,25 +1,50 @@
 """Command-line interface for git-year-end-report."""
 
+import asyncio
+import hashlib
 import logging
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
 import typer
+import yaml
 from rich.console import Console
 from rich.logging import RichHandler
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .config import load_config
+from .cache import CACHE_DIR
+from .config import Config, ForgeConfig, load_config
+from .forge_client import ForgeClient, run_async
 from .forges.github import GitHubClient
 from .forges.gitlab import GitLabClient
 from .forges.pagure import PagureClient
-from .models import Report
+from .models import Report, RepoStats
 from .report import generate_markdown_report
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 app = typer.Typer(help="Generate year-end activity reports from git forges")
 console = Console()
 logger = logging.getLogger("git_year_end_report")
 
+_FORGE_CLIENTS: dict[str, type[ForgeClient]] = {
+    "github": GitHubClient,
+    "gitlab": GitLabClient,
+    "pagure": PagureClient,
+}
+
+# Enumerated repositories older than this are not reused by generate
+_REPO_CACHE_MAX_AGE = 24 * 60 * 60
+
+# Repositories fetched concurrently per forge. The clients bound their own
+# request rate and connection count, so this only caps scheduled work.
+_REPO_CONCURRENCY = 16
+
 
 def setup_logging(verbose: bool):
     """Configure logging based on verbosity level."""
@@ -45,6 +70,205 @@ def main():
     app()
 
 
+def _apply_forge_filter(config: Config, forges: list[str], config_file: Path) -> None:
+    """Restrict the configured forges to those named on the command line.
+
+    Args:
+        config: Loaded configuration, updated in place
+        forges: Forge names given with --forge (case-insensitive)
+        config_file: Path of the configuration file, for error messages
+
+    Raises:
+        typer.Exit: If none of the named forges are configured
+    """
+    forge_names_lower = frozenset(f.lower() for f in forges)
+    filtered_forges = [
+        fc for fc in config.forges if fc.name.lower() in forge_names_lower
+    ]
+    if not filtered_forges:
+        console.print(
+            f"[red]Error: None of the specified forges ({', '.join(forges)}) "
+            f"are configured in {config_file}[/red]"
+        )
+        raise typer.Exit(1)
+    config.forges = filtered_forges
+
+
+def _repo_cache_path(config: Config) -> Path:
+    """Return the path of the enumerated repository cache for a configuration.
+
+    The file name carries a fingerprint of the configured forges, endpoints
+    and usernames, so that runs with different configuration files never
+    share saved repositories. It must be taken before --forge filters the
+    forges, since enumerate and generate may be limited to different ones.
+
+    Args:
+        config: Loaded configuration
+
+    Returns:
+        Path of the YAML file holding the saved repository lists
+    """
+    forges = sorted(
+        (fc.name.lower(), fc.endpoint or "", sorted(u.lower() for u in fc.usernames))
+        for fc in config.forges
+    )
+    fingerprint = hashlib.sha256(repr(forges).encode()).hexdigest()[:12]
+    return CACHE_DIR / f"repos-{config.year}-{fingerprint}.yaml"
+
+
+def _save_cached_repos(path: Path, results: dict[str, list[str]]) -> None:
+    """Save enumerated repositories for later use by generate.
+
+    Only the forges in results are replaced. Lists that an earlier run saved
+    for other forges, e.g. when enumerate was limited with --forge or a
+    forge failed, are kept as long as they are recent enough for generate
+    to use. Nothing is written if no forge was enumerated successfully.
+
+    Args:
+        path: Repository cache file returned by _repo_cache_path()
+        results: Sorted repository lists keyed by forge name
+    """
+    if not results:
+        return
+
+    forges = {}
+    try:
+        # Rewriting the file refreshes its age, so only carry over lists
+        # that are not already too old to use
+        if time.time() - path.stat().st_mtime <= _REPO_CACHE_MAX_AGE:
+            with open(path) as f:
+                cached = yaml.load(f, Loader=SafeLoader)
+            # Ignore files that were edited or written in another format
+            if isinstance(cached, dict) and isinstance(cached.get("forges"), dict):
+                forges = cached["forges"]
+    except FileNotFoundError:
+        pass
+    except (OSError, yaml.YAMLError) as e:
+        logger.debug(f"Could not read {path}, replacing it: {e}")
+
+    forges.update(results)
+    data = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "forges": forges,
+    }
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            yaml.dump(data, f, Dumper=SafeDumper)
+    except OSError as e:
+        logger.debug(f"Could not save enumerated repositories to {path}: {e}")
+
+
+def _merge_cached_repos(config: Config, path: Path) -> None:
+    """Add repositories saved by a recent enumerate run to the configuration.
+
+    Args:
+        config: Loaded configuration, updated in place
+        path: Repository cache file returned by _repo_cache_path()
+    """
+    try:
+        if time.time() - path.stat().st_mtime > _REPO_CACHE_MAX_AGE:
+            console.print(
+                f"[yellow]Warning: Enumerated repositories in {path} are more than "
+                f"a day old, ignoring them[/yellow]"
+            )
+            return
+        with open(path) as f:
+            cached = yaml.load(f, Loader=SafeLoader)
+    except FileNotFoundError:
+        console.print(
+            f"[yellow]Warning: No enumerated repositories for {config.year}, "
+            f"run the enumerate command first[/yellow]"
+        )
+        return
+    except (OSError, yaml.YAMLError) as e:
+        console.print(f"[yellow]Warning: Could not read {path}: {e}[/yellow]")
+        return
+
+    if not isinstance(cached, dict) or not isinstance(cached.get("forges"), dict):
+        console.print(
+            f"[yellow]Warning: {path} does not hold enumerated repositories, "
+            f"ignoring it[/yellow]"
+        )
+        return
+
+    cached_forges = cached["forges"]
+    for forge_config in config.forges:
+        repos = cached_forges.get(forge_config.name)
+        if not isinstance(repos, list):
+            continue
+        known = set(forge_config.repos)
+        forge_config.repos.extend(repo for repo in repos if repo not in known)
+
+
+async def _fetch_repo_stats(
+    client: ForgeClient,
+    forge_config: ForgeConfig,
+    repo: str,
+    start_date: datetime,
+    end_date: datetime,
+    semaphore: asyncio.Semaphore,
+    progress: Progress,
+) -> RepoStats:
+    """Fetch statistics for one repository, reporting progress as it goes.
+
+    Args:
+        client: Forge client to fetch with
+        forge_config: Configuration of the forge the repository belongs to
+        repo: Repository identifier
+        start_date: Start of date range
+        end_date: End of date range
+        semaphore: Limits how many repositories of this forge are in flight
+        progress: Progress display to update
+
+    Returns:
+        RepoStats object for the repository
+    """
+    async with semaphore:
+        task = progress.add_task(
+            f"Fetching stats for {forge_config.name}/{repo}...", total=None
+        )
+        try:
+            repo_stats = await client.get_repo_stats_async(
+                repo, forge_config.usernames, start_date, end_date
+            )
+            progress.update(
+                task,
+                description=f"[green][/green] {forge_config.name}/{repo}",
+            )
+            return repo_stats
+        except Exception as e:
+            progress.update(
+                task,
+                description=f"[red][/red] {forge_config.name}/{repo}: {e}",
+            )
+            raise
+        finally:
+            progress.remove_task(task)
+
+
+async def _gather_repo_stats(
+    jobs: list[tuple], clients: list[tuple[ForgeConfig, ForgeClient]]
+) -> list:
+    """Run all repository fetches concurrently.
+
+    Args:
+        jobs: (forge_config, repo, coroutine) tuples to run
+        clients: (forge_config, client) pairs to close once all jobs finish
+
+    Returns:
+        RepoStats or exception for each job, in job order
+    """
+    try:
+        return await asyncio.gather(
+            *(coro for _, _, coro in jobs), return_exceptions=True
+        )
+    finally:
+        for _, client in clients:
+            await client.aclose()
+
+
 @app.command()
 def generate(
     config_file: Path = typer.Option(
@@ -68,6 +292,11 @@ def generate(
         "-f",
         help="Only fetch from specified forge(s). Can be used multiple times. Example: -f github -f gitlab",
     ),
+    use_cached_repos: bool = typer.Option(
+        False,
+        "--use-cached-repos",
+        help="Also fetch repositories found by an enumerate run in the last day",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -88,23 +317,18 @@ def generate(
         console.print(f"[red]Error loading configuration:[/red] {e}")
         raise typer.Exit(1)
 
+    repo_cache_path = _repo_cache_path(config)
+
     # Filter forges if specified on command line
     if forges:
-        forge_names_lower = [f.lower() for f in forges]
-        filtered_forges = [
-            fc for fc in config.forges if fc.name.lower() in forge_names_lower
-        ]
-        if not filtered_forges:
-            console.print(
-                f"[red]Error: None of the specified forges ({', '.join(forges)}) "
-                f"are configured in {config_file}[/red]"
-            )
-            raise typer.Exit(1)
-        config.forges = filtered_forges
+        _apply_forge_filter(config, forges, config_file)
         console.print(
             f"[yellow]Filtering to forges: {', '.join(fc.name for fc in config.forges)}[/yellow]\n"
         )
 
+    if use_cached_repos:
+        _merge_cached_repos(config, repo_cache_path)
+
     start_date = datetime(config.year, 1, 1, tzinfo=timezone.utc)
     end_date = datetime.now(timezone.utc)
 
@@ -120,12 +344,6 @@ def generate(
     console.print(f"Period: {start_date.date()} to {end_date.date()}")
     console.print(f"Output: {output_path}\n")
 
-    forge_clients = {
-        "github": GitHubClient,
-        "gitlab": GitLabClient,
-        "pagure": PagureClient,
-    }
-
     # Track API calls per forge
     api_call_counts = {}
 
@@ -134,50 +352,58 @@ def generate(
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
+        clients = []
+        jobs = []
         for forge_config in config.forges:
             forge_name = forge_config.name.lower()
 
-            if forge_name not in forge_clients:
+            if forge_name not in _FORGE_CLIENTS:
                 console.print(
                     f"[yellow]Warning: Unknown forge '{forge_name}', skipping[/yellow]"
                 )
                 continue
 
-            client_class = forge_clients[forge_name]
+            client_class = _FORGE_CLIENTS[forge_name]
             endpoint = forge_config.endpoint
 
             if endpoint:
                 client = client_class(token=forge_config.token, endpoint=endpoint)
             else:
                 client = client_class(token=forge_config.token)
+            clients.append((forge_config, client))
 
+            # Bound in-flight repositories per forge
+            semaphore = asyncio.Semaphore(_REPO_CONCURRENCY)
             for repo in forge_config.repos:
-                task = progress.add_task(
-                    f"Fetching stats for {forge_config.name}/{repo}...", total=None
+                jobs.append(
+                    (
+                        forge_config,
+                        repo,
+                        _fetch_repo_stats(
+                            client,
+                            forge_config,
+                            repo,
+                            start_date,
+                            end_date,
+                            semaphore,
+                            progress,
+                        ),
+                    )
                 )
 
-                try:
-                    repo_stats = client.get_repo_stats(
-                        repo, forge_config.usernames, start_date, end_date
-                    )
-                    report.repos.append(repo_stats)
-                    progress.update(
-                        task,
-                        description=f"[green][/green] {forge_config.name}/{repo}",
-                    )
-                except Exception as e:
-                    progress.update(
-                        task,
-                        description=f"[red][/red] {forge_config.name}/{repo}: {e}",
-                    )
-                    console.print(
-                        f"[red]Error fetching stats for {forge_config.name}/{repo}:[/red] {e}"
-                    )
+        results = run_async(_gather_repo_stats(jobs, clients))
 
-                progress.remove_task(task)
+    for (forge_config, repo, _), result in zip(jobs, results):
+        if isinstance(result, Exception):
+            console.print(
+                f"[red]Error fetching stats for {forge_config.name}/{repo}:[/red] {result}"
+            )
+        else:
+            report.repos.append(result)
 
-            # Store API call count for this forge
-            api_call_counts[forge_config.name] = client.get_api_call_count()
+    # Store API call count for each forge
+    for forge_config, client in clients:
+        api_call_counts[forge_config.name] = client.get_api_call_count()
 
     # Display API call statistics if verbose mode is enabled
     if verbose:
@@ -273,19 +499,13 @@ def enumerate(
         console.print(f"[red]Error loading configuration:[/red] {e}")
         raise typer.Exit(1)
 
+    repo_cache_path = _repo_cache_path(config)
+
     # Filter forges if specified on command line
     if forges:
-        forge_names_lower = [f.lower() for f in forges]
-        filtered_forges = [
-            fc for fc in config.forges if fc.name.lower() in forge_names_lower
-        ]
-        if not filtered_forges:
-            console.print(
-                f"[red]Error: None of the specified forges ({', '.join(forges)}) "
-                f"are configured in {config_file}[/red]"
-            )
-            raise typer.Exit(1)
-        config.forges = filtered_forges
+        _apply_forge_filter(config, forges, config_file)
+
+    forge_by_name = {fc.name.lower(): fc for fc in config.forges}
 
     start_date = datetime(config.year, 1, 1, tzinfo=timezone.utc)
     end_date = datetime.now(timezone.utc)
@@ -297,12 +517,6 @@ def enumerate(
     console.print(f"Year: {config.year}")
     console.print(f"Period: {start_date.date()} to {end_date.date()}\n")
 
-    forge_clients = {
-        "github": GitHubClient,
-        "gitlab": GitLabClient,
-        "pagure": PagureClient,
-    }
-
     results = {}
     api_call_counts = {}
 
@@ -314,13 +528,13 @@ def enumerate(
         for forge_config in config.forges:
             forge_name = forge_config.name.lower()
 
-            if forge_name not in forge_clients:
+            if forge_name not in _FORGE_CLIENTS:
                 console.print(
                     f"[yellow]Warning: Unknown forge '{forge_name}', skipping[/yellow]"
                 )
                 continue
 
-            client_class = forge_clients[forge_name]
+            client_class = _FORGE_CLIENTS[forge_name]
             endpoint = forge_config.endpoint
 
             if endpoint:
@@ -364,6 +578,8 @@ def enumerate(
             total_calls += count
         console.print(f"  [bold]Total: {total_calls} API calls[/bold]\n")
 
+    _save_cached_repos(repo_cache_path, results)
+
     # Output YAML-formatted results
     console.print("\n[bold green]Discovered Repositories[/bold green]\n")
     console.print("Copy this into your config.yaml file:\n")
@@ -376,10 +592,7 @@ def enumerate(
             console.print(f"    token: ${{{forge_name.upper()}_TOKEN}}")
             console.print("    usernames:")
             # Get usernames from config
-            forge_config = next(
-                (fc for fc in config.forges if fc.name.lower() == forge_name.lower()),
-                None,
-            )
+            forge_config = forge_by_name.get(forge_name.lower())
             if forge_config:
                 for username in forge_config.usernames:
                     console.print(f"      - {username}")
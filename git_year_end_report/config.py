@@ -7,6 +7,14 @@ from pathlib import Path
 
 import yaml
 
+try:
+    # Prefer the LibYAML-backed loader when PyYAML was built against it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+_ENV_VAR_RE = re.compile(r"\$\{([^}]+)\}")
+
 
 @dataclass
 class ForgeConfig:
@@ -40,41 +48,31 @@ def _expand_env_vars(value: str) -> str:
     Returns:
         String with environment variables expanded
     """
-    if not isinstance(value, str):
+    # Most values are plain literals; skip the regex engine for them
+    if "${" not in value:
         return value
 
-    pattern = re.compile(r"\$\{([^}]+)\}")
-
     def replacer(match):
         var_name = match.group(1)
         return os.environ.get(var_name, match.group(0))
 
-    return pattern.sub(replacer, value)
+    return _ENV_VAR_RE.sub(replacer, value)
 
 
-def _expand_dict(data: dict) -> dict:
-    """Recursively expand environment variables in a dictionary.
+class _EnvVarLoader(SafeLoader):
+    """YAML loader that expands environment variables in string scalars.
 
-    Args:
-        data: Dictionary with potential environment variable references
-
-    Returns:
-        Dictionary with all environment variables expanded
+    Expanding while each scalar is constructed avoids a second walk over
+    the loaded document.
     """
-    result = {}
-    for key, value in data.items():
-        if isinstance(value, dict):
-            result[key] = _expand_dict(value)
-        elif isinstance(value, list):
-            result[key] = [
-                _expand_dict(item) if isinstance(item, dict) else _expand_env_vars(str(item)) if isinstance(item, str) else item
-                for item in value
-            ]
-        elif isinstance(value, str):
-            result[key] = _expand_env_vars(value)
-        else:
-            result[key] = value
-    return result
+
+
+def _construct_str(loader: _EnvVarLoader, node: yaml.ScalarNode) -> str:
+    """Construct a string scalar with environment variables expanded."""
+    return _expand_env_vars(loader.construct_scalar(node))
+
+
+_EnvVarLoader.add_constructor("tag:yaml.org,2002:str", _construct_str)
 
 
 def load_config(config_path: str | Path) -> Config:
@@ -96,13 +94,11 @@ def load_config(config_path: str | Path) -> Config:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
     with open(config_path) as f:
-        raw_config = yaml.safe_load(f)
+        raw_config = yaml.load(f, Loader=_EnvVarLoader)
 
     if not raw_config:
         raise ValueError("Configuration file is empty")
 
-    raw_config = _expand_dict(raw_config)
-
     if "year" not in raw_config:
         raise ValueError("Configuration must specify a 'year'")
 
@@ -1,10 +1,72 @@
 """Base class for git forge API clients."""
 
+import asyncio
+import logging
+import time
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine, Hashable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from datetime import datetime
 
+import httpx
+
 from .models import RepoStats
 
+try:
+    # uvloop is an optional, faster drop-in event loop (not available on Windows)
+    from uvloop import new_event_loop as _loop_factory
+except ImportError:
+    _loop_factory = None
+
+logger = logging.getLogger(__name__)
+
+# Statuses retried by _send_with_retry(): rate limiting and transient
+# server errors
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_ATTEMPTS = 5
+
+
+def run_async(coro: Coroutine):
+    """Run a coroutine on a new event loop, using uvloop when installed.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        Result of the coroutine
+    """
+    return asyncio.run(coro, loop_factory=_loop_factory)
+
+
+class RequestSlots:
+    """Bounds how many requests are in flight on the running event loop.
+
+    An asyncio.Semaphore is bound to the event loop that first waits on it,
+    and each synchronous call runs on a new loop, so a fresh semaphore is
+    created whenever the running loop changes.
+    """
+
+    def __init__(self, limit: int):
+        """Initialize the slots.
+
+        Args:
+            limit: Maximum number of requests in flight
+        """
+        self.limit = limit
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @asynccontextmanager
+    async def hold(self) -> AsyncIterator[None]:
+        """Wait for a free slot and hold it while the request runs."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.limit)
+            self._loop = loop
+
+        async with self._semaphore:
+            yield
+
 
 class ForgeClient(ABC):
     """Abstract base class for git forge API clients.
@@ -13,6 +75,12 @@ class ForgeClient(ABC):
     implement, making it easy to add support for new git forges.
     """
 
+    # Requests a client sends concurrently through _send_with_retry()
+    max_concurrent_requests = 8
+
+    # Seconds a result shared by _coalesce() is reused after it completes
+    response_ttl = 120.0
+
     def __init__(self, token: str | None = None):
         """Initialize the forge client.
 
@@ -21,6 +89,9 @@ class ForgeClient(ABC):
         """
         self.token = token
         self.api_call_count = 0
+        self._requests: dict[Hashable, asyncio.Future] = {}
+        self._request_expiry: dict[Hashable, float] = {}
+        self._request_slots = RequestSlots(self.max_concurrent_requests)
 
     @abstractmethod
     def get_repo_stats(
@@ -43,6 +114,33 @@ class ForgeClient(ABC):
         """
         pass
 
+    async def get_repo_stats_async(
+        self,
+        repo: str,
+        usernames: list[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> RepoStats:
+        """Fetch statistics for a repository without blocking the event loop.
+
+        The default implementation runs get_repo_stats() in a worker thread so
+        synchronous clients can be scheduled alongside asynchronous ones.
+        Clients built on httpx.AsyncClient override this with a native
+        implementation.
+
+        Args:
+            repo: Repository identifier (e.g., "owner/repo")
+            usernames: List of usernames to track
+            start_date: Start of date range
+            end_date: End of date range
+
+        Returns:
+            RepoStats object containing all user statistics for the repo
+        """
+        return await asyncio.to_thread(
+            self.get_repo_stats, repo, usernames, start_date, end_date
+        )
+
     @abstractmethod
     def get_forge_name(self) -> str:
         """Return the name of this forge (e.g., 'GitHub', 'GitLab').
@@ -85,3 +183,165 @@ class ForgeClient(ABC):
     def reset_api_call_count(self) -> None:
         """Reset the API call counter to zero."""
         self.api_call_count = 0
+
+    async def aclose(self) -> None:
+        """Release any network resources held by the client.
+
+        The default implementation does nothing; clients that keep a
+        long-lived HTTP connection pool override this to close it.
+        """
+
+    async def __aenter__(self):
+        """Use the client as an async context manager that closes on exit."""
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the client when leaving the context."""
+        await self.aclose()
+
+    async def _coalesce(self, key: Hashable, fetch: Callable[[], Awaitable]):
+        """Run a fetch once per key and share its result.
+
+        Concurrent callers with the same key wait for the same request, and
+        later callers reuse its result for response_ttl seconds after it
+        completes. Failed fetches are forgotten so that they can be retried.
+
+        Args:
+            key: Identifies the request, e.g. its URL and query parameters
+            fetch: Returns an awaitable that performs the request
+
+        Returns:
+            Result of the fetch
+        """
+        future = self._requests.get(key)
+        expiry = self._request_expiry.get(key)
+        if expiry is not None and expiry < time.monotonic():
+            future = None
+
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._requests[key] = future
+            self._request_expiry.pop(key, None)
+
+            def on_done(done: asyncio.Future) -> None:
+                # Leave a newer fetch that replaced an expired one alone
+                if self._requests.get(key) is not done:
+                    return
+                if done.cancelled() or done.exception() is not None:
+                    self._requests.pop(key, None)
+                else:
+                    self._request_expiry[key] = time.monotonic() + self.response_ttl
+
+            future.add_done_callback(on_done)
+
+        # Shield the shared request so one cancelled caller doesn't cancel it
+        # for everyone else
+        return await asyncio.shield(future)
+
+    def _request_slot(self, url: str) -> AbstractAsyncContextManager:
+        """Return the context that holds a slot while a request runs.
+
+        By default at most max_concurrent_requests requests are in flight at
+        once. Clients with several rate limits override this to pick one.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Async context manager to send the request in
+        """
+        return self._request_slots.hold()
+
+    def _record_response(self, url: str, response: httpx.Response) -> None:
+        """Record rate limit state reported by a response.
+
+        The default implementation does nothing.
+
+        Args:
+            url: Request URL
+            response: Response received for it
+        """
+
+    def _is_retryable(self, response: httpx.Response) -> bool:
+        """Return whether a failed response is worth retrying.
+
+        Args:
+            response: Response to check
+
+        Returns:
+            True if the status is in _RETRY_STATUSES
+        """
+        return response.status_code in _RETRY_STATUSES
+
+    def _retry_delay(self, url: str, response: httpx.Response, attempt: int) -> float:
+        """Return how long to wait before retrying a request.
+
+        Args:
+            url: Request URL
+            response: Response that is being retried
+            attempt: Number of the attempt that failed, starting at 0
+
+        Returns:
+            The Retry-After value if the server sent one, else exponential
+            backoff, in seconds
+        """
+        retry_after = response.headers.get("Retry-After", "")
+        return float(retry_after) if retry_after.isdigit() else 2.0**attempt
+
+    async def _send_with_retry(
+        self, client: httpx.AsyncClient, method: str, url: str, **kwargs
+    ) -> httpx.Response:
+        """Send a request, bounding concurrency and retrying when throttled.
+
+        This is the only retry loop; clients customize it through
+        _request_slot(), _record_response(), _is_retryable() and
+        _retry_delay(). Retryable responses are retried up to _MAX_ATTEMPTS
+        times.
+
+        Args:
+            client: HTTP client to send the request with
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed on to httpx.AsyncClient.request()
+
+        Returns:
+            The final response, which may still be an error
+        """
+        for attempt in range(_MAX_ATTEMPTS):
+            async with self._request_slot(url):
+                response = await client.request(method, url, **kwargs)
+            self.api_call_count += 1
+            self._record_response(url, response)
+
+            if attempt == _MAX_ATTEMPTS - 1 or not self._is_retryable(response):
+                return response
+
+            delay = self._retry_delay(url, response, attempt)
+            logger.debug(
+                f"{response.status_code} from {url}, retrying in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{_MAX_ATTEMPTS})"
+            )
+            await asyncio.sleep(delay)
+
+        return response
+
+    def _run_sync(self, coro: Coroutine):
+        """Run a coroutine to completion from synchronous code.
+
+        The client's connection pool is bound to the event loop that created
+        it, so it is closed before the loop shuts down.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Result of the coroutine
+        """
+
+        async def run():
+            try:
+                return await coro
+            finally:
+                await self.aclose()
+
+        return run_async(run())
@@ -1,15 +1,116 @@
 """GitHub API client implementation."""
 
+import asyncio
 import logging
-from datetime import datetime
+import re
+import time
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import TypeVar
 
 import httpx
+import orjson
 
-from ..forge_client import ForgeClient
+from ..cache import CACHE_DIR, ResponseCache
+from ..forge_client import ForgeClient, RequestSlots
 from ..models import RepoStats, UserStats
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+_NEXT_LINK_RE = re.compile(r'<([^>]+)>\s*;\s*rel="next"')
+_LAST_LINK_RE = re.compile(r'<([^>]+)>\s*;\s*rel="last"')
+
+# Maximum number of results the Search API returns for a query
+_SEARCH_RESULT_LIMIT = 1000
+
+# Users per GraphQL count query; each user adds seven aliased searches
+_GRAPHQL_USERS_PER_QUERY = 5
+
+# Seconds a settled search result is reused before it is fetched again.
+# Issues can still be reopened, and commits with an old author date pushed,
+# after the range has ended, so settled results are not kept for good
+_SETTLED_MAX_AGE = 7 * 24 * 60 * 60
+
+
+def _is_settled(end_date: datetime) -> bool:
+    """Return whether a date range ended long enough ago to reuse its results.
+
+    Search results for a range that ended more than a day ago rarely change,
+    which leaves a margin for search index lag.
+
+    Args:
+        end_date: End of date range
+
+    Returns:
+        True if results for the range can be reused for _SETTLED_MAX_AGE
+    """
+    return end_date < datetime.now(timezone.utc) - timedelta(days=1)
+
+
+def _is_frozen(query: str, end_date: datetime) -> bool:
+    """Return whether a search's results can be reused without revalidation.
+
+    Matches on created:, closed:, merged: and author-date: ranges rarely
+    change once the range has settled. Matches on updated: do: an issue
+    updated again after the range ends drops out of the results.
+
+    Args:
+        query: Search query
+        end_date: End of the query's date range
+
+    Returns:
+        True if the results can be reused for _SETTLED_MAX_AGE
+    """
+    return _is_settled(end_date) and "updated:" not in query
+
+
+class GitHubRateLimiter:
+    """Throttles requests against one GitHub rate limit bucket.
+
+    GitHub tracks separate limits for the core REST API, the Search API and
+    the GraphQL API. Each bucket gets its own limiter, which bounds the
+    number of requests in flight and holds new requests back until the
+    reset time when a response reports that the limit is used up.
+    """
+
+    def __init__(self, max_concurrency: int):
+        """Initialize the rate limiter.
+
+        Args:
+            max_concurrency: Maximum number of requests in flight
+        """
+        self.next_allowed_at = 0.0
+        self._slots = RequestSlots(max_concurrency)
+
+    @asynccontextmanager
+    async def slot(self):
+        """Wait until a request may be sent and hold a slot while it runs."""
+        async with self._slots.hold():
+            delay = self.next_allowed_at - time.time()
+            if delay > 0:
+                logger.debug(f"GitHub API: Rate limited, waiting {delay:.1f}s")
+                await asyncio.sleep(delay)
+            yield
+
+    def update(self, response: httpx.Response) -> None:
+        """Record the rate limit state reported by a response.
+
+        Args:
+            response: Response from the GitHub API
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            self.next_allowed_at = max(
+                self.next_allowed_at, time.time() + int(retry_after)
+            )
+        elif response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = response.headers.get("X-RateLimit-Reset", "")
+            if reset.isdigit():
+                self.next_allowed_at = max(self.next_allowed_at, float(reset))
+
 
 class GitHubClient(ForgeClient):
     """GitHub API client for fetching repository statistics."""
@@ -29,6 +130,11 @@ class GitHubClient(ForgeClient):
         }
         if self.token:
             self.headers["Authorization"] = f"Bearer {self.token}"
+        self._client: httpx.AsyncClient | None = None
+        self._cache = ResponseCache(CACHE_DIR / "github", token=self.token)
+        self._core_limiter = GitHubRateLimiter(60)
+        self._search_limiter = GitHubRateLimiter(10)
+        self._graphql_limiter = GitHubRateLimiter(10)
 
     def get_forge_name(self) -> str:
         """Return the forge name."""
@@ -43,6 +149,8 @@ class GitHubClient(ForgeClient):
     ) -> RepoStats:
         """Fetch statistics for a GitHub repository.
 
+        Synchronous wrapper around get_repo_stats_async().
+
         Args:
             repo: Repository in format "owner/repo"
             usernames: List of GitHub usernames to track
@@ -52,274 +160,554 @@ class GitHubClient(ForgeClient):
         Returns:
             RepoStats object with all statistics
         """
-        repo_stats = RepoStats(forge="GitHub", repo=repo)
+        return self._run_sync(
+            self.get_repo_stats_async(repo, usernames, start_date, end_date)
+        )
 
-        for username in usernames:
-            user_stats = UserStats(username=username)
+    async def get_repo_stats_async(
+        self,
+        repo: str,
+        usernames: list[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> RepoStats:
+        """Fetch statistics for a GitHub repository.
 
-            user_stats.issues_opened = self._count_issues(
-                repo, username, start_date, end_date, state="open", created=True
-            )
-            user_stats.issues_closed = self._count_issues(
-                repo, username, start_date, end_date, state="closed", created=False
-            )
-            user_stats.prs_opened = self._count_pull_requests(
-                repo, username, start_date, end_date, state="open", created=True
-            )
-            user_stats.prs_closed = self._count_pull_requests(
-                repo, username, start_date, end_date, state="closed", created=False
-            )
-            user_stats.prs_merged = self._count_merged_pull_requests(
-                repo, username, start_date, end_date
-            )
-            user_stats.commits = self._count_commits(repo, username, start_date, end_date)
-            user_stats.pr_comments = self._count_pr_comments(
-                repo, username, start_date, end_date
-            )
-            user_stats.issue_comments = self._count_issue_comments(
-                repo, username, start_date, end_date
-            )
+        With a token, every search-based metric for every user is counted in
+        a single GraphQL request. Without one (GraphQL requires
+        authentication), or if that request fails, each metric is counted
+        with its own Search API request. Commits are not searchable through
+        GraphQL, so they are counted with the REST Search API either way,
+        concurrently with the other metrics.
+
+        Args:
+            repo: Repository in format "owner/repo"
+            usernames: List of GitHub usernames to track
+            start_date: Start of date range
+            end_date: End of date range
 
-            repo_stats.add_user_stats(user_stats)
+        Returns:
+            RepoStats object with all statistics
+        """
+        repo_stats = RepoStats(forge="GitHub", repo=repo)
+
+        # Commits are only searchable through REST, however the other
+        # metrics are counted, so they are counted once alongside them
+        commits, all_counts = await asyncio.gather(
+            asyncio.gather(
+                *(
+                    self._count_commits(repo, username, start_date, end_date)
+                    for username in usernames
+                )
+            ),
+            self._count_searches(repo, usernames, start_date, end_date),
+        )
+
+        for username, user_commits, counts in zip(usernames, commits, all_counts):
+            repo_stats.add_user_stats(
+                UserStats(username=username, commits=user_commits, **counts)
+            )
 
         return repo_stats
 
-    def _make_request(self, url: str, params: dict | None = None) -> list[dict]:
-        """Make paginated requests to GitHub API.
+    async def _count_searches(
+        self,
+        repo: str,
+        usernames: list[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[dict[str, int]]:
+        """Count the search-based metrics of every user.
 
         Args:
-            url: API endpoint URL
-            params: Query parameters
+            repo: Repository in format "owner/repo"
+            usernames: List of GitHub usernames to track
+            start_date: Start of date range
+            end_date: End of date range
 
         Returns:
-            List of all results from paginated responses
+            Mapping of UserStats field name to count for each user, in the
+            order of usernames
         """
-        results = []
-        params = params or {}
-        params["per_page"] = 100
-
-        with httpx.Client(headers=self.headers, timeout=30.0) as client:
-            page_num = 1
-            while url:
-                logger.debug(f"GitHub API: GET {url} (page {page_num}, params: {params})")
-                response = client.get(url, params=params)
-                self.api_call_count += 1
-                response.raise_for_status()
-                data = response.json()
-
-                if isinstance(data, list):
-                    logger.debug(f"GitHub API: Received {len(data)} items")
-                    results.extend(data)
-                else:
-                    logger.debug(f"GitHub API: Received single item response")
-                    results.append(data)
-
-                link_header = response.headers.get("Link", "")
-                url = self._get_next_page_url(link_header)
-                params = None
-                page_num += 1
-
-        logger.debug(f"GitHub API: Total results: {len(results)}")
-        return results
+        if self.token:
+            try:
+                return await self._count_searches_graphql(
+                    repo, usernames, start_date, end_date
+                )
+            except Exception as e:
+                logger.debug(f"GitHub API: GraphQL batch failed, using REST search: {e}")
+
+        # Every user's metrics are independent, so fetch them all at once
+        return await asyncio.gather(
+            *(
+                self._count_user_searches(repo, username, start_date, end_date)
+                for username in usernames
+            )
+        )
 
-    def _get_next_page_url(self, link_header: str) -> str | None:
-        """Extract next page URL from Link header.
+    async def _count_user_searches(
+        self, repo: str, username: str, start_date: datetime, end_date: datetime
+    ) -> dict[str, int]:
+        """Count a single user's search-based metrics concurrently.
 
         Args:
-            link_header: GitHub Link header value
+            repo: Repository in format "owner/repo"
+            username: GitHub username
+            start_date: Start of date range
+            end_date: End of date range
 
         Returns:
-            URL of next page or None if no more pages
+            Mapping of UserStats field name to count
         """
-        if not link_header:
-            return None
-
-        for link in link_header.split(","):
-            parts = link.split(";")
-            if len(parts) == 2 and 'rel="next"' in parts[1]:
-                return parts[0].strip("<> ")
+        queries = self._search_queries(repo, username, start_date, end_date)
+        counts = await asyncio.gather(
+            *(
+                self._count_search(query, _is_frozen(query, end_date))
+                for query in queries.values()
+            )
+        )
 
-        return None
+        return dict(zip(queries, counts))
 
-    def _count_issues(
+    async def _count_searches_graphql(
         self,
         repo: str,
-        username: str,
+        usernames: list[str],
         start_date: datetime,
         end_date: datetime,
-        state: str,
-        created: bool,
-    ) -> int:
-        """Count issues for a user in a date range.
+    ) -> list[dict[str, int]]:
+        """Count every user's search-based metrics with aliased GraphQL queries.
 
-        Uses GitHub Search API to fetch user's issues with date filtering,
-        then filters to target repository.
+        Users are batched into queries of at most _GRAPHQL_USERS_PER_QUERY
+        users each, which run concurrently.
 
         Args:
             repo: Repository in format "owner/repo"
-            username: GitHub username
+            usernames: List of GitHub usernames to track
             start_date: Start of date range
             end_date: End of date range
-            state: Issue state ("open" or "closed")
-            created: If True, count created issues; if False, count closed issues
 
         Returns:
-            Number of issues
+            Mapping of UserStats field name to count for each user, in the
+            order of usernames
         """
-        url = f"{self.endpoint}/search/issues"
-
-        date_range = f"{start_date.date().isoformat()}..{end_date.date().isoformat()}"
-        date_qualifier = "created" if created else "closed"
-
-        # Build search query: author, repo, type, date range, and optionally state
-        query_parts = [
-            f"author:{username}",
-            f"repo:{repo}",
-            "type:issue",
-            f"{date_qualifier}:{date_range}",
+        batches = [
+            usernames[i : i + _GRAPHQL_USERS_PER_QUERY]
+            for i in range(0, len(usernames), _GRAPHQL_USERS_PER_QUERY)
         ]
+        batch_counts = await asyncio.gather(
+            *(self._count_all(repo, batch, start_date, end_date) for batch in batches)
+        )
 
-        if not created:
-            query_parts.append(f"state:{state}")
-
-        query = " ".join(query_parts)
-        params = {"q": query, "per_page": 100}
+        return [counts for batch in batch_counts for counts in batch]
 
-        try:
-            response = self._make_request(url, params)
-            # Search API returns {"items": [...]} format
-            items = response[0].get("items", []) if response else []
-            return len(items)
-        except Exception:
-            return 0
-
-    def _count_pull_requests(
+    async def _count_all(
         self,
         repo: str,
-        username: str,
+        usernames: list[str],
         start_date: datetime,
         end_date: datetime,
-        state: str,
-        created: bool,
-    ) -> int:
-        """Count pull requests for a user in a date range.
-
-        Uses GitHub Search API to fetch user's PRs with date filtering,
-        then filters to target repository.
+    ) -> list[dict[str, int]]:
+        """Count the search-based metrics of several users in one GraphQL query.
 
         Args:
             repo: Repository in format "owner/repo"
-            username: GitHub username
+            usernames: GitHub usernames to count in this query
             start_date: Start of date range
             end_date: End of date range
-            state: PR state ("open" or "closed")
-            created: If True, count created PRs; if False, count closed PRs
 
         Returns:
-            Number of pull requests
+            Mapping of UserStats field name to count for each user, in the
+            order of usernames
         """
-        url = f"{self.endpoint}/search/issues"
+        # Alias each search as u<index>_<field>; queries are passed as
+        # variables so usernames never need escaping inside the document
+        variables = {}
+        for index, username in enumerate(usernames):
+            queries = self._search_queries(repo, username, start_date, end_date)
+            for field, query in queries.items():
+                variables[f"u{index}_{field}"] = query
+
+        # Frozen searches are sent apart from the others so that their
+        # response can be reused without revalidation
+        frozen = {
+            alias: query
+            for alias, query in variables.items()
+            if _is_frozen(query, end_date)
+        }
+        live = {
+            alias: query for alias, query in variables.items() if alias not in frozen
+        }
+        results = await asyncio.gather(
+            *(
+                self._graphql(self._count_query(group), group, settled=group is frozen)
+                for group in (frozen, live)
+                if group
+            )
+        )
+        data = {alias: result for part in results for alias, result in part.items()}
+
+        all_counts = []
+        for index in range(len(usernames)):
+            prefix = f"u{index}_"
+            all_counts.append(
+                {
+                    alias.removeprefix(prefix): result["issueCount"]
+                    for alias, result in data.items()
+                    if alias.startswith(prefix)
+                }
+            )
 
-        date_range = f"{start_date.date().isoformat()}..{end_date.date().isoformat()}"
-        date_qualifier = "created" if created else "closed"
-
-        # Build search query: author, repo, type, date range, and optionally state
-        query_parts = [
-            f"author:{username}",
-            f"repo:{repo}",
-            "type:pr",
-            f"{date_qualifier}:{date_range}",
-        ]
+        return all_counts
 
-        if not created:
-            query_parts.append(f"state:{state}")
+    @staticmethod
+    def _count_query(variables: dict[str, str]) -> str:
+        """Build a GraphQL document counting the results of aliased searches.
 
-        query = " ".join(query_parts)
-        params = {"q": query, "per_page": 100}
+        Args:
+            variables: Search query per alias
 
-        try:
-            response = self._make_request(url, params)
-            # Search API returns {"items": [...]} format
-            items = response[0].get("items", []) if response else []
-            return len(items)
-        except Exception:
-            return 0
+        Returns:
+            GraphQL query document
+        """
+        declarations = ", ".join(f"${alias}: String!" for alias in variables)
+        selections = " ".join(
+            f"{alias}: search(query: ${alias}, type: ISSUE, first: 1) {{ issueCount }}"
+            for alias in variables
+        )
+        return f"query({declarations}) {{ {selections} }}"
 
-    def _count_merged_pull_requests(
-        self, repo: str, username: str, start_date: datetime, end_date: datetime
-    ) -> int:
-        """Count merged pull requests for a user in a date range.
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
 
-        Uses GitHub Search API to fetch user's merged PRs with date filtering.
+        A single client is reused for every request so connections (and
+        their TLS sessions) are pooled and HTTP/2 streams can be multiplexed.
+
+        Returns:
+            Shared async HTTP client
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=30.0,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _limiter_for(self, url: str) -> GitHubRateLimiter:
+        """Return the limiter of the rate limit bucket a URL counts against.
 
         Args:
-            repo: Repository in format "owner/repo"
-            username: GitHub username
-            start_date: Start of date range
-            end_date: End of date range
+            url: Request URL
 
         Returns:
-            Number of merged pull requests
+            Limiter for the GraphQL, Search or core REST API
         """
-        url = f"{self.endpoint}/search/issues"
+        if url.endswith("/graphql"):
+            return self._graphql_limiter
+        if "/search/" in url:
+            return self._search_limiter
+        return self._core_limiter
 
-        date_range = f"{start_date.date().isoformat()}..{end_date.date().isoformat()}"
+    def _request_slot(self, url: str) -> AbstractAsyncContextManager:
+        """Hold a slot of the URL's rate limit bucket while a request runs."""
+        return self._limiter_for(url).slot()
 
-        # Build search query: author, repo, type, merged state, and merged date
-        query = f"author:{username} repo:{repo} type:pr is:merged merged:{date_range}"
-        params = {"q": query, "per_page": 100}
+    def _record_response(self, url: str, response: httpx.Response) -> None:
+        """Record the X-RateLimit state a response reports for its bucket."""
+        self._limiter_for(url).update(response)
 
-        try:
-            response = self._make_request(url, params)
-            # Search API returns {"items": [...]} format
-            items = response[0].get("items", []) if response else []
-            return len(items)
-        except Exception:
-            return 0
+    def _is_retryable(self, response: httpx.Response) -> bool:
+        """Return whether a failed response is worth retrying.
 
-    def _count_commits(
-        self, repo: str, username: str, start_date: datetime, end_date: datetime
-    ) -> int:
-        """Count commits for a user in a date range.
+        GitHub also signals rate limiting with 403, but a 403 without
+        rate limit headers is a permission error.
 
-        Uses GitHub Search API to fetch user's commits with date filtering.
+        Args:
+            response: Response to check
+
+        Returns:
+            True if the request should be retried
+        """
+        if response.status_code == 403:
+            return (
+                "Retry-After" in response.headers
+                or response.headers.get("X-RateLimit-Remaining") == "0"
+            )
+        return super()._is_retryable(response)
+
+    def _retry_delay(self, url: str, response: httpx.Response, attempt: int) -> float:
+        """Return how long to wait before retrying, honoring the rate limit reset.
 
         Args:
-            repo: Repository in format "owner/repo"
-            username: GitHub username
-            start_date: Start of date range
-            end_date: End of date range
+            url: Request URL
+            response: Response that is being retried
+            attempt: Number of the attempt that failed, starting at 0
 
         Returns:
-            Number of commits
+            Delay in seconds
         """
-        url = f"{self.endpoint}/search/commits"
+        return max(
+            super()._retry_delay(url, response, attempt),
+            self._limiter_for(url).next_allowed_at - time.time(),
+        )
 
-        date_range = f"{start_date.date().isoformat()}..{end_date.date().isoformat()}"
+    async def _get_page(
+        self, url: str, params: dict | None, settled: bool = False
+    ) -> tuple:
+        """Fetch a single page from the GitHub API.
 
-        # Build search query: author, repo, and author date
-        query = f"author:{username} repo:{repo} author-date:{date_range}"
-        params = {"q": query, "per_page": 100}
+        Responses are cached on disk and revalidated with conditional
+        requests; a 304 Not Modified reply reuses the cached page, including
+        its Link header for pagination. Pages stored for a settled date
+        range are reused without a request for _SETTLED_MAX_AGE.
 
-        try:
-            response = self._make_request(url, params)
-            # Search API returns {"items": [...]} format
-            items = response[0].get("items", []) if response else []
-            return len(items)
-        except Exception:
-            return 0
+        Args:
+            url: API endpoint URL
+            params: Query parameters
+            settled: Whether the query covers a date range that has ended
 
-    def _count_pr_comments(
-        self, repo: str, username: str, start_date: datetime, end_date: datetime
-    ) -> int:
-        """Count PR review comments for a user in a date range.
+        Returns:
+            Tuple of (decoded JSON body, Link header value)
+        """
+        cached = await self._cache.aget(url, params)
+        if ResponseCache.is_fresh(cached):
+            logger.debug("GitHub API: Settled date range, using cached response")
+            return cached["body"], cached["link"]
+
+        response = await self._send_with_retry(
+            self._get_client(),
+            "GET",
+            url,
+            params=params,
+            headers=ResponseCache.conditional_headers(cached),
+        )
+
+        if response.status_code == 304 and cached is not None:
+            logger.debug("GitHub API: Not modified, using cached response")
+            return cached["body"], cached["link"]
+
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        await self._cache.aset(
+            url,
+            params,
+            response,
+            data,
+            max_age=_SETTLED_MAX_AGE if settled else None,
+        )
+        return data, response.headers.get("Link", "")
+
+    async def _paginate(
+        self,
+        url: str,
+        params: dict | None,
+        reducer: Callable[[T, list[dict]], T],
+        initial: T,
+    ) -> T:
+        """Fold every page of a GitHub API listing into an accumulator.
+
+        Each page's items are handed to reducer as soon as the page arrives,
+        so callers that only need a summary never hold the whole listing.
+
+        When the number of pages is known after the first response, the
+        remaining pages are requested concurrently. Search responses give it
+        through total_count, other listings may advertise the last page in
+        their Link header. Otherwise the rel="next" links are followed one
+        page at a time.
 
-        Uses GitHub Search API to find PRs where user commented, filtering
-        to target repository and date range. This counts the number of PRs
-        with comments, not individual comment count.
+        Args:
+            url: API endpoint URL
+            params: Query parameters
+            reducer: Called with the accumulator and a page's items, returns
+                the new accumulator
+            initial: Initial accumulator value
+
+        Returns:
+            Final accumulator value
+        """
+        params = {**(params or {}), "per_page": 100}
+
+        logger.debug(f"GitHub API: GET {url} (page 1, params: {params})")
+        data, link_header = await self._get_page(url, params)
+        result = reducer(initial, self._page_items(data))
+
+        if isinstance(data, dict) and "total_count" in data:
+            # The Search API serves at most 1000 results per query
+            total = min(data["total_count"], _SEARCH_RESULT_LIMIT)
+            last_page = -(-total // params["per_page"])
+        else:
+            last_page = self._get_last_page_number(link_header)
+
+        if last_page and last_page > 1:
+            logger.debug(f"GitHub API: Fetching pages 2-{last_page} of {url} concurrently")
+            for page in asyncio.as_completed(
+                [
+                    self._get_page(url, {**params, "page": page_num})
+                    for page_num in range(2, last_page + 1)
+                ]
+            ):
+                data, _ = await page
+                result = reducer(result, self._page_items(data))
+        elif not last_page and not self._is_short_page(data, params):
+            url = self._get_next_page_url(link_header)
+            page_num = 2
+            while url:
+                logger.debug(f"GitHub API: GET {url} (page {page_num})")
+                data, link_header = await self._get_page(url, None)
+                result = reducer(result, self._page_items(data))
+                if self._is_short_page(data, params):
+                    break
+                url = self._get_next_page_url(link_header)
+                page_num += 1
 
-        Note: GitHub's search API doesn't provide granular comment counting,
-        so this approximates activity by counting PRs with user comments.
+        return result
+
+    def _is_short_page(self, data, params: dict) -> bool:
+        """Return whether a list page holds fewer items than requested.
+
+        GitHub fills every page but the last, so a short page ends the
+        listing without consulting its Link header.
+
+        Args:
+            data: Decoded JSON body of the page
+            params: Query parameters the listing was requested with
+
+        Returns:
+            True if the page is a list shorter than per_page
+        """
+        return isinstance(data, list) and len(data) < params["per_page"]
+
+    def _page_items(self, data) -> list[dict]:
+        """Return the items of one response page.
+
+        Args:
+            data: Decoded JSON body of the page
+
+        Returns:
+            The page itself for list responses, the "items" of Search API
+            responses, or the single object of any other response
+        """
+        if isinstance(data, list):
+            items = data
+        elif isinstance(data, dict) and "items" in data:
+            items = data["items"]
+        else:
+            items = [data]
+
+        logger.debug(f"GitHub API: Received {len(items)} items")
+        return items
+
+    async def _search_count(self, url: str, params: dict, settled: bool = False) -> int:
+        """Count the results of a search query without downloading them.
+
+        The Search API reports the number of matches in total_count, so a
+        single one-item page is enough.
+
+        Args:
+            url: Search API endpoint URL
+            params: Query parameters including the "q" search query
+            settled: Whether the query covers a date range that has ended
+
+        Returns:
+            Total number of matching results
+        """
+        params = {**params, "per_page": 1}
+        logger.debug(f"GitHub API: GET {url} (count only, params: {params})")
+        data, _ = await self._get_page(url, params, settled)
+        return data.get("total_count", 0)
+
+    async def _graphql(self, query: str, variables: dict, settled: bool = False) -> dict:
+        """Run a query against the GitHub GraphQL API.
+
+        GraphQL responses carry no validators, so they are only cached, for
+        _SETTLED_MAX_AGE, when the query covers a settled date range.
+
+        Args:
+            query: GraphQL query document
+            variables: Values for the variables declared by the query
+            settled: Whether the query covers a date range that has ended
+
+        Returns:
+            The "data" object of the response
+
+        Raises:
+            ValueError: If the response reports errors
+        """
+        # GitHub Enterprise serves GraphQL at /api/graphql next to /api/v3
+        if self.endpoint.endswith("/api/v3"):
+            url = self.endpoint.removesuffix("/v3") + "/graphql"
+        else:
+            url = f"{self.endpoint}/graphql"
+
+        cache_params = {"query": query, **variables}
+        cached = await self._cache.aget(url, cache_params) if settled else None
+        if ResponseCache.is_fresh(cached):
+            logger.debug("GitHub API: Settled date range, using cached response")
+            return cached["body"]
+
+        logger.debug(f"GitHub API: POST {url} ({len(variables)} searches)")
+        response = await self._send_with_retry(
+            self._get_client(),
+            "POST",
+            url,
+            json={"query": query, "variables": variables},
+        )
+        response.raise_for_status()
+
+        body = orjson.loads(response.content)
+        if body.get("errors"):
+            raise ValueError(f"GraphQL query failed: {body['errors'][0].get('message')}")
+
+        if settled:
+            await self._cache.aset(
+                url, cache_params, response, body["data"], max_age=_SETTLED_MAX_AGE
+            )
+        return body["data"]
+
+    def _get_next_page_url(self, link_header: str) -> str | None:
+        """Extract next page URL from Link header.
+
+        Args:
+            link_header: GitHub Link header value
+
+        Returns:
+            URL of next page or None if no more pages
+        """
+        match = _NEXT_LINK_RE.search(link_header or "")
+        return match.group(1) if match else None
+
+    def _get_last_page_number(self, link_header: str) -> int | None:
+        """Extract the last page number from Link header.
+
+        Args:
+            link_header: GitHub Link header value
+
+        Returns:
+            Number of the last page or None if it is not advertised
+        """
+        match = _LAST_LINK_RE.search(link_header or "")
+        if not match:
+            return None
+
+        page = httpx.URL(match.group(1)).params.get("page")
+        return int(page) if page and page.isdigit() else None
+
+    def _search_queries(
+        self, repo: str, username: str, start_date: datetime, end_date: datetime
+    ) -> dict[str, str]:
+        """Build the issue search queries behind a user's metrics.
+
+        Comment metrics count the issues and PRs the user commented on
+        rather than individual comments, because the search API doesn't
+        provide granular comment counting.
 
         Args:
             repo: Repository in format "owner/repo"
@@ -328,35 +716,52 @@ class GitHubClient(ForgeClient):
             end_date: End of date range
 
         Returns:
-            Number of PRs where user commented
+            Mapping of UserStats field name to search query, for every
+            metric except commits
         """
-        url = f"{self.endpoint}/search/issues"
-
         date_range = f"{start_date.date().isoformat()}..{end_date.date().isoformat()}"
 
-        # Build search query: commenter, repo, type, and date range
-        query = f"commenter:{username} repo:{repo} type:pr updated:{date_range}"
-        params = {"q": query, "per_page": 100}
+        return {
+            "issues_opened": f"author:{username} repo:{repo} type:issue created:{date_range}",
+            "issues_closed": (
+                f"author:{username} repo:{repo} type:issue closed:{date_range} state:closed"
+            ),
+            "prs_opened": f"author:{username} repo:{repo} type:pr created:{date_range}",
+            "prs_closed": (
+                f"author:{username} repo:{repo} type:pr closed:{date_range} state:closed"
+            ),
+            "prs_merged": f"author:{username} repo:{repo} type:pr is:merged merged:{date_range}",
+            "pr_comments": f"commenter:{username} repo:{repo} type:pr updated:{date_range}",
+            "issue_comments": (
+                f"commenter:{username} repo:{repo} type:issue updated:{date_range}"
+            ),
+        }
+
+    async def _count_search(self, query: str, settled: bool) -> int:
+        """Count issues and pull requests matching a search query.
+
+        Args:
+            query: Issue search query
+            settled: Whether the query covers a date range that has ended
+
+        Returns:
+            Number of matching issues or pull requests
+        """
+        url = f"{self.endpoint}/search/issues"
+        params = {"q": query}
 
         try:
-            response = self._make_request(url, params)
-            # Search API returns {"items": [...]} format
-            items = response[0].get("items", []) if response else []
-            return len(items)
+            return await self._search_count(url, params, settled)
         except Exception:
             return 0
 
-    def _count_issue_comments(
+    async def _count_commits(
         self, repo: str, username: str, start_date: datetime, end_date: datetime
     ) -> int:
-        """Count issue comments for a user in a date range.
-
-        Uses GitHub Search API to find issues where user commented, filtering
-        to target repository and date range. This counts the number of issues
-        with comments, not individual comment count.
+        """Count commits for a user in a date range.
 
-        Note: GitHub's search API doesn't provide granular comment counting,
-        so this approximates activity by counting issues with user comments.
+        Uses the GitHub Search API to match the user's commits, reading the
+        count from total_count.
 
         Args:
             repo: Repository in format "owner/repo"
@@ -365,21 +770,18 @@ class GitHubClient(ForgeClient):
             end_date: End of date range
 
         Returns:
-            Number of issues where user commented
+            Number of commits
         """
-        url = f"{self.endpoint}/search/issues"
+        url = f"{self.endpoint}/search/commits"
 
         date_range = f"{start_date.date().isoformat()}..{end_date.date().isoformat()}"
 
-        # Build search query: commenter, repo, type, and date range
-        query = f"commenter:{username} repo:{repo} type:issue updated:{date_range}"
-        params = {"q": query, "per_page": 100}
+        # Build search query: author, repo, and author date
+        query = f"author:{username} repo:{repo} author-date:{date_range}"
+        params = {"q": query}
 
         try:
-            response = self._make_request(url, params)
-            # Search API returns {"items": [...]} format
-            items = response[0].get("items", []) if response else []
-            return len(items)
+            return await self._search_count(url, params, _is_settled(end_date))
         except Exception:
             return 0
 
@@ -394,6 +796,26 @@ class GitHubClient(ForgeClient):
         Uses GitHub's search API to find repositories where the specified
         users have activity.
 
+        Args:
+            usernames: List of GitHub usernames to search for
+            start_date: Start of date range
+            end_date: End of date range
+
+        Returns:
+            Set of repository identifiers in "owner/repo" format
+        """
+        return self._run_sync(
+            self._enumerate_repos_async(usernames, start_date, end_date)
+        )
+
+    async def _enumerate_repos_async(
+        self,
+        usernames: list[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> set[str]:
+        """Enumerate repositories where users have been active.
+
         Args:
             usernames: List of GitHub usernames to search for
             start_date: Start of date range
@@ -405,22 +827,68 @@ class GitHubClient(ForgeClient):
         repos = set()
 
         for username in usernames:
+            try:
+                repos.update(await self._search_activity(username, start_date, end_date))
+                continue
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 422:
+                    # If search fails, skip this username
+                    continue
+                logger.debug(
+                    f"GitHub API: Combined search rejected for {username}, "
+                    "searching issues, PRs and comments separately"
+                )
+            except Exception:
+                continue
+
             # Search for issues created by user
             repos.update(
-                self._search_issues(username, start_date, end_date, issue_type="issue")
+                await self._search_issues(
+                    username, start_date, end_date, issue_type="issue"
+                )
             )
 
             # Search for PRs created by user
             repos.update(
-                self._search_issues(username, start_date, end_date, issue_type="pr")
+                await self._search_issues(username, start_date, end_date, issue_type="pr")
             )
 
             # Search for issue comments by user
-            repos.update(self._search_comments(username, start_date, end_date))
+            repos.update(await self._search_comments(username, start_date, end_date))
 
         return repos
 
-    def _search_issues(
+    async def _search_activity(
+        self, username: str, start_date: datetime, end_date: datetime
+    ) -> set[str]:
+        """Search for issues and PRs a user created or commented on.
+
+        A single boolean query covers what _search_issues() and
+        _search_comments() find with three, saving search rate limit.
+
+        Args:
+            username: GitHub username
+            start_date: Start of date range
+            end_date: End of date range
+
+        Returns:
+            Set of repository identifiers
+
+        Raises:
+            httpx.HTTPStatusError: If the search fails, with status 422 when
+                GitHub rejects the query
+        """
+        url = f"{self.endpoint}/search/issues"
+
+        date_range = f"{start_date.date().isoformat()}..{end_date.date().isoformat()}"
+        query = f"(author:{username} OR commenter:{username}) created:{date_range}"
+
+        # Parenthesized boolean queries need the advanced search syntax
+        params = {"q": query, "advanced_search": "true", "per_page": 100}
+
+        return await self._paginate(url, params, self._add_repositories, set())
+
+    async def _search_issues(
         self, username: str, start_date: datetime, end_date: datetime, issue_type: str
     ) -> set[str]:
         """Search for issues or PRs created by a user.
@@ -443,25 +911,14 @@ class GitHubClient(ForgeClient):
         params = {"q": query, "per_page": 100}
 
         try:
-            response = self._make_request(url, params)
-            # Search API returns {"items": [...]} format
-            items = response[0].get("items", []) if response else []
-
-            for item in items:
-                repo_url = item.get("repository_url", "")
-                if repo_url:
-                    # Extract owner/repo from URL like https://api.github.com/repos/owner/repo
-                    parts = repo_url.split("/repos/")
-                    if len(parts) == 2:
-                        repos.add(parts[1])
-
+            repos = await self._paginate(url, params, self._add_repositories, repos)
         except Exception:
             # If search fails, skip this username
             pass
 
         return repos
 
-    def _search_comments(
+    async def _search_comments(
         self, username: str, start_date: datetime, end_date: datetime
     ) -> set[str]:
         """Search for comments made by a user.
@@ -483,20 +940,29 @@ class GitHubClient(ForgeClient):
         params = {"q": query, "per_page": 100}
 
         try:
-            response = self._make_request(url, params)
-            # Search API returns {"items": [...]} format
-            items = response[0].get("items", []) if response else []
-
-            for item in items:
-                repo_url = item.get("repository_url", "")
-                if repo_url:
-                    # Extract owner/repo from URL
-                    parts = repo_url.split("/repos/")
-                    if len(parts) == 2:
-                        repos.add(parts[1])
-
+            repos = await self._paginate(url, params, self._add_repositories, repos)
         except Exception:
             # If search fails, skip this username
             pass
 
         return repos
+
+    def _add_repositories(self, repos: set[str], items: list[dict]) -> set[str]:
+        """Add the repositories of search result items to a set.
+
+        Args:
+            repos: Set of repository identifiers to add to
+            items: Search API result items
+
+        Returns:
+            The updated set
+        """
+        for item in items:
+            repo_url = item.get("repository_url", "")
+            if repo_url:
+                # Extract owner/repo from URL like https://api.github.com/repos/owner/repo
+                parts = repo_url.rsplit("/", 2)
+                if len(parts) == 3:
+                    repos.add(f"{parts[1]}/{parts[2]}")
+
+        return repos
@@ -1,16 +1,49 @@
 """GitLab API client implementation."""
 
+import asyncio
 import logging
-from datetime import datetime
+from collections import Counter
+from datetime import datetime, timedelta
+from functools import lru_cache
 from urllib.parse import quote
 
 import httpx
+import orjson
 
 from ..forge_client import ForgeClient
 from ..models import RepoStats, UserStats
 
 logger = logging.getLogger(__name__)
 
+# Users per GraphQL count query; each user adds four aliased counts
+_GRAPHQL_USERS_PER_QUERY = 5
+
+# Project connection and date filter arguments counted for each UserStats field.
+# mergeRequests has no closed date filter, so prs_closed comes from the REST list
+_GRAPHQL_COUNTS = {
+    "issues_opened": ("issues", "createdAfter", "createdBefore"),
+    "issues_closed": ("issues", "closedAfter", "closedBefore"),
+    "prs_opened": ("mergeRequests", "createdAfter", "createdBefore"),
+    "prs_merged": ("mergeRequests", "mergedAfter", "mergedBefore"),
+}
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> float:
+    """Parse an ISO 8601 timestamp returned by the GitLab API.
+
+    datetime.fromisoformat() accepts a trailing "Z" natively, so no string
+    rewriting is needed. Results are memoized because the same timestamps
+    are parsed again for every tracked user.
+
+    Args:
+        value: Timestamp string such as "2025-03-01T12:00:00.000Z"
+
+    Returns:
+        Seconds since the epoch, for cheap comparison against date bounds
+    """
+    return datetime.fromisoformat(value).timestamp()
+
 
 class GitLabClient(ForgeClient):
     """GitLab API client for fetching repository statistics."""
@@ -29,6 +62,9 @@ class GitLabClient(ForgeClient):
         self.headers = {}
         if self.token:
             self.headers["PRIVATE-TOKEN"] = self.token
+        self._client: httpx.AsyncClient | None = None
+        # Set once the instance rejects the GraphQL count queries
+        self._graphql_unsupported = False
 
     def get_forge_name(self) -> str:
         """Return the forge name."""
@@ -43,6 +79,40 @@ class GitLabClient(ForgeClient):
     ) -> RepoStats:
         """Fetch statistics for a GitLab repository.
 
+        Synchronous wrapper around get_repo_stats_async().
+
+        Args:
+            repo: Repository in format "group/project"
+            usernames: List of GitLab usernames to track
+            start_date: Start of date range
+            end_date: End of date range
+
+        Returns:
+            RepoStats object with all statistics
+        """
+        return self._run_sync(
+            self.get_repo_stats_async(repo, usernames, start_date, end_date)
+        )
+
+    async def get_repo_stats_async(
+        self,
+        repo: str,
+        usernames: list[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> RepoStats:
+        """Fetch statistics for a GitLab repository.
+
+        Issue and merge request counts for all users are taken from aliased
+        GraphQL count queries, except closed merge requests, which GraphQL
+        cannot filter by close date and are counted from the project's
+        closed REST merge request list. If the queries fail, every count is
+        derived from the project's REST issue and merge request lists
+        instead. When the
+        instance rejects the queries outright, for example an older
+        self-hosted GitLab, the REST lists are used for every later
+        repository without trying GraphQL again.
+
         Args:
             repo: Repository in format "group/project"
             usernames: List of GitLab usernames to track
@@ -55,204 +125,469 @@ class GitLabClient(ForgeClient):
         repo_stats = RepoStats(forge="GitLab", repo=repo)
         project_id = quote(repo, safe="")
 
-        for username in usernames:
-            user_stats = UserStats(username=username)
-
-            user_stats.issues_opened = self._count_issues(
-                project_id, username, start_date, end_date, created=True
-            )
-            user_stats.issues_closed = self._count_issues(
-                project_id, username, start_date, end_date, created=False
-            )
-            user_stats.prs_opened = self._count_merge_requests(
-                project_id, username, start_date, end_date, created=True
-            )
-            user_stats.prs_closed = self._count_merge_requests(
-                project_id, username, start_date, end_date, created=False
-            )
-            user_stats.prs_merged = self._count_merged_merge_requests(
-                project_id, username, start_date, end_date
-            )
-            user_stats.commits = self._count_commits(
-                project_id, username, start_date, end_date
-            )
-            user_stats.pr_comments = self._count_mr_comments(
-                project_id, username, start_date, end_date
-            )
-            user_stats.issue_comments = self._count_issue_comments(
-                project_id, username, start_date, end_date
+        item_counts = None
+        if not self._graphql_unsupported:
+            try:
+                item_counts = await self._count_items_graphql(
+                    repo, usernames, start_date, end_date
+                )
+            except httpx.HTTPStatusError as e:
+                if e.response.is_client_error:
+                    self._disable_graphql(e)
+                else:
+                    logger.debug(f"GitLab API: GraphQL counts failed for {repo}: {e}")
+            except ValueError as e:
+                # The query was rejected, or the endpoint did not answer JSON
+                self._disable_graphql(e)
+            except Exception as e:
+                logger.debug(f"GitLab API: GraphQL counts failed for {repo}: {e}")
+
+        if item_counts is None:
+            item_counts = await self._count_items(project_id, start_date, end_date)
+        else:
+            item_counts["prs_closed"] = await self._count_closed_mrs(
+                project_id, start_date, end_date
             )
 
+        # Every user's metrics are independent, so fetch them all at once
+        all_user_stats = await asyncio.gather(
+            *(
+                self._get_user_stats(
+                    repo, project_id, username, item_counts, start_date, end_date
+                )
+                for username in usernames
+            )
+        )
+        for user_stats in all_user_stats:
             repo_stats.add_user_stats(user_stats)
 
         return repo_stats
 
-    def _make_request(self, url: str, params: dict | None = None) -> list[dict]:
-        """Make paginated requests to GitLab API.
+    async def _get_user_stats(
+        self,
+        repo: str,
+        project_id: str,
+        username: str,
+        item_counts: dict[str, Counter[str]],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> UserStats:
+        """Fetch all metrics for a single user, issuing the requests concurrently.
 
         Args:
-            url: API endpoint URL
-            params: Query parameters
+            repo: Repository in format "group/project"
+            project_id: URL-encoded project ID
+            username: GitLab username
+            item_counts: Issue and merge request counts of the project per
+                lowercased author username, keyed by UserStats field
+            start_date: Start of date range
+            end_date: End of date range
 
         Returns:
-            List of all results from paginated responses
+            UserStats object for the user
         """
-        results = []
-        params = params or {}
-        params["per_page"] = 100
-
-        with httpx.Client(headers=self.headers, timeout=30.0) as client:
-            page = 1
-            while True:
-                params["page"] = page
-                logger.debug(f"GitLab API: GET {url} (page {page}, params: {params})")
-                response = client.get(url, params=params)
-                self.api_call_count += 1
-                response.raise_for_status()
-                data = response.json()
-
-                if isinstance(data, list):
-                    logger.debug(f"GitLab API: Received {len(data)} items")
-                else:
-                    logger.debug(f"GitLab API: Received single item response")
+        commits, events = await asyncio.gather(
+            self._count_commits(project_id, username, start_date, end_date),
+            # One events fetch answers both comment counts
+            self._list_user_events(username, "commented", "note", start_date, end_date),
+        )
+
+        return UserStats(
+            username=username,
+            **{
+                field: counts[username.lower()]
+                for field, counts in item_counts.items()
+            },
+            commits=commits,
+            pr_comments=self._count_comments(
+                events, repo, "MergeRequest", start_date, end_date
+            ),
+            issue_comments=self._count_comments(
+                events, repo, "Issue", start_date, end_date
+            ),
+        )
+
+    async def _count_items(
+        self, project_id: str, start_date: datetime, end_date: datetime
+    ) -> dict[str, Counter[str]]:
+        """Count issues and merge requests per author from the REST lists.
+
+        The issue and MR lists are fetched once per repository and every
+        count of every user is derived from them locally. Anything created,
+        closed or merged in the range was updated in it too, so older items
+        are left out on the server.
 
-                if not data:
-                    break
+        Args:
+            project_id: URL-encoded project ID
+            start_date: Start of date range
+            end_date: End of date range
 
-                if isinstance(data, list):
-                    results.extend(data)
-                else:
-                    results.append(data)
-                    break
+        Returns:
+            Counts per lowercased author username, keyed by UserStats field
+        """
+        updated_after = start_date.isoformat()
+        issues, mrs = await asyncio.gather(
+            self._make_request(
+                f"{self.endpoint}/projects/{project_id}/issues",
+                {"state": "all", "updated_after": updated_after},
+            ),
+            self._make_request(
+                f"{self.endpoint}/projects/{project_id}/merge_requests",
+                {"state": "all", "updated_after": updated_after},
+            ),
+        )
+
+        return {
+            "issues_opened": self._count_by_author(
+                issues, "created_at", start_date, end_date
+            ),
+            "issues_closed": self._count_by_author(
+                issues, "closed_at", start_date, end_date
+            ),
+            "prs_opened": self._count_by_author(mrs, "created_at", start_date, end_date),
+            "prs_closed": self._count_by_author(mrs, "closed_at", start_date, end_date),
+            "prs_merged": self._count_by_author(mrs, "merged_at", start_date, end_date),
+        }
 
-                total_pages = response.headers.get("X-Total-Pages")
-                if total_pages and page >= int(total_pages):
-                    logger.debug(f"GitLab API: Reached last page ({page}/{total_pages})")
-                    break
+    async def _count_closed_mrs(
+        self, project_id: str, start_date: datetime, end_date: datetime
+    ) -> Counter[str]:
+        """Count merge requests closed in a date range per author.
 
-                page += 1
+        Only closed (not merged) merge requests updated since the start are
+        listed, as closing one updates it.
 
-        logger.debug(f"GitLab API: Total results: {len(results)}")
-        return results
+        Args:
+            project_id: URL-encoded project ID
+            start_date: Start of date range
+            end_date: End of date range
 
-    def _count_issues(
+        Returns:
+            Number of merge requests closed in the date range, keyed by
+            lowercased author username
+        """
+        mrs = await self._make_request(
+            f"{self.endpoint}/projects/{project_id}/merge_requests",
+            {"state": "closed", "updated_after": start_date.isoformat()},
+        )
+        return self._count_by_author(mrs, "closed_at", start_date, end_date)
+
+    def _disable_graphql(self, error: Exception) -> None:
+        """Stop using GraphQL counts after the instance rejected them.
+
+        Args:
+            error: Error the GraphQL request failed with
+        """
+        if self._graphql_unsupported:
+            return
+        self._graphql_unsupported = True
+        logger.warning(
+            f"GitLab API: {self.endpoint} does not support the GraphQL count "
+            f"queries, using REST issue and merge request lists instead: {error}"
+        )
+
+    async def _count_items_graphql(
         self,
-        project_id: str,
-        username: str,
+        repo: str,
+        usernames: list[str],
         start_date: datetime,
         end_date: datetime,
-        created: bool,
-    ) -> int:
-        """Count issues for a user in a date range.
+    ) -> dict[str, Counter[str]]:
+        """Count issues and merge requests per author with GraphQL.
+
+        Users are batched into queries of at most _GRAPHQL_USERS_PER_QUERY
+        users each, which run concurrently. GitLab returns only the counts,
+        so no issue or merge request is downloaded.
 
         Args:
-            project_id: URL-encoded project ID
-            username: GitLab username
+            repo: Repository in format "group/project"
+            usernames: List of GitLab usernames to track
             start_date: Start of date range
             end_date: End of date range
-            created: If True, count created issues; if False, count closed issues
 
         Returns:
-            Number of issues
+            Counts per lowercased author username, keyed by UserStats field
         """
-        url = f"{self.endpoint}/projects/{project_id}/issues"
-        params = {
-            "author_username": username if created else None,
-            "created_after": start_date.isoformat() if created else None,
-            "created_before": end_date.isoformat() if created else None,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-
-        issues = self._make_request(url, params)
-
-        if not created:
-            issues = [
-                i
-                for i in issues
-                if i.get("closed_at")
-                and start_date
-                <= datetime.fromisoformat(i["closed_at"].replace("Z", "+00:00"))
-                <= end_date
-            ]
+        batches = [
+            usernames[i : i + _GRAPHQL_USERS_PER_QUERY]
+            for i in range(0, len(usernames), _GRAPHQL_USERS_PER_QUERY)
+        ]
+        batch_counts = await asyncio.gather(
+            *(
+                self._count_batch_graphql(repo, batch, start_date, end_date)
+                for batch in batches
+            )
+        )
 
-        return len(issues)
+        item_counts = {field: Counter() for field in _GRAPHQL_COUNTS}
+        for counts in batch_counts:
+            for field, field_counts in counts.items():
+                item_counts[field].update(field_counts)
+        return item_counts
 
-    def _count_merge_requests(
+    async def _count_batch_graphql(
         self,
-        project_id: str,
-        username: str,
+        repo: str,
+        usernames: list[str],
         start_date: datetime,
         end_date: datetime,
-        created: bool,
-    ) -> int:
-        """Count merge requests for a user in a date range.
+    ) -> dict[str, Counter[str]]:
+        """Count issues and merge requests of several users in one GraphQL query.
 
         Args:
-            project_id: URL-encoded project ID
-            username: GitLab username
+            repo: Repository in format "group/project"
+            usernames: GitLab usernames to count in this query
             start_date: Start of date range
             end_date: End of date range
-            created: If True, count created MRs; if False, count closed MRs
 
         Returns:
-            Number of merge requests
+            Counts per lowercased author username, keyed by UserStats field
+
+        Raises:
+            ValueError: If the project is not found
         """
-        url = f"{self.endpoint}/projects/{project_id}/merge_requests"
-        params = {
-            "author_username": username if created else None,
-            "created_after": start_date.isoformat() if created else None,
-            "created_before": end_date.isoformat() if created else None,
-            "state": "all",
+        # Alias each count as u<index>_<field>; usernames are passed as
+        # variables so they never need escaping inside the document
+        variables = {
+            "path": repo,
+            "start": start_date.isoformat(),
+            "end": end_date.isoformat(),
         }
-        params = {k: v for k, v in params.items() if v is not None}
+        selections = []
+        for index, username in enumerate(usernames):
+            variables[f"u{index}"] = username
+            for field, (connection, after, before) in _GRAPHQL_COUNTS.items():
+                selections.append(
+                    f"u{index}_{field}: {connection}(authorUsername: $u{index}, "
+                    f"{after}: $start, {before}: $end) {{ count }}"
+                )
+
+        declarations = ", ".join(
+            f"$u{index}: String!" for index in range(len(usernames))
+        )
+        query = (
+            f"query($path: ID!, $start: Time!, $end: Time!, {declarations}) "
+            f"{{ project(fullPath: $path) {{ {' '.join(selections)} }} }}"
+        )
+        data = await self._graphql(query, variables)
+
+        project = data.get("project")
+        if project is None:
+            raise ValueError(f"Project not found: {repo}")
+
+        counts = {field: Counter() for field in _GRAPHQL_COUNTS}
+        for index, username in enumerate(usernames):
+            for field in _GRAPHQL_COUNTS:
+                counts[field][username.lower()] = project[f"u{index}_{field}"]["count"]
+        return counts
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        A single client is reused for every request so connections (and
+        their TLS sessions) are pooled and HTTP/2 streams can be multiplexed.
 
-        mrs = self._make_request(url, params)
+        Returns:
+            Shared async HTTP client
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=30.0,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            )
+        return self._client
 
-        if not created:
-            mrs = [
-                mr
-                for mr in mrs
-                if mr.get("closed_at")
-                and start_date
-                <= datetime.fromisoformat(mr["closed_at"].replace("Z", "+00:00"))
-                <= end_date
-            ]
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
-        return len(mrs)
+    async def _graphql(self, query: str, variables: dict) -> dict:
+        """Run a query against the GitLab GraphQL API.
 
-    def _count_merged_merge_requests(
-        self, project_id: str, username: str, start_date: datetime, end_date: datetime
-    ) -> int:
-        """Count merged merge requests for a user in a date range.
+        Args:
+            query: GraphQL query document
+            variables: Values for the variables declared by the query
+
+        Returns:
+            The "data" object of the response
+
+        Raises:
+            ValueError: If the response reports errors
+        """
+        # GraphQL is served at /api/graphql next to /api/v4
+        url = self.endpoint.removesuffix("/v4") + "/graphql"
+
+        logger.debug(f"GitLab API: POST {url} (variables: {variables})")
+        response = await self._send_with_retry(
+            self._get_client(),
+            "POST",
+            url,
+            json={"query": query, "variables": variables},
+        )
+        response.raise_for_status()
+
+        body = orjson.loads(response.content)
+        if body.get("errors"):
+            raise ValueError(f"GraphQL query failed: {body['errors'][0].get('message')}")
+        return body["data"]
+
+    async def _make_request(self, url: str, params: dict | None = None) -> list[dict]:
+        """Make paginated requests to GitLab API.
+
+        Identical requests are only sent once per client: the user lookups
+        and events fetched for every repository are shared between them.
+        Callers must not modify the returned list.
 
         Args:
-            project_id: URL-encoded project ID
-            username: GitLab username
-            start_date: Start of date range
-            end_date: End of date range
+            url: API endpoint URL
+            params: Query parameters
 
         Returns:
-            Number of merged merge requests
+            List of all results from paginated responses
         """
-        url = f"{self.endpoint}/projects/{project_id}/merge_requests"
-        params = {
-            "author_username": username,
-            "state": "merged",
-        }
+        params = params or {}
+        key = (url, tuple(sorted(params.items())))
+        return await self._coalesce(key, lambda: self._fetch_pages(url, params))
 
-        mrs = self._make_request(url, params)
-        merged_mrs = [
-            mr
-            for mr in mrs
-            if mr.get("merged_at")
-            and start_date
-            <= datetime.fromisoformat(mr["merged_at"].replace("Z", "+00:00"))
-            <= end_date
-        ]
+    async def _fetch_pages(self, url: str, params: dict) -> list[dict]:
+        """Fetch every page of a GitLab API listing.
+
+        Only list endpoints are paginated; every endpoint this client uses
+        returns a JSON array.
+
+        Args:
+            url: API endpoint URL
+            params: Query parameters
+
+        Returns:
+            List of all results from paginated responses
+        """
+        params = {**params, "per_page": 100}
+
+        data, total_pages, next_page = await self._get_page(url, params, 1)
+        results = list(data)
+
+        if total_pages:
+            # GitLab reports the page count on the first page, so the
+            # remaining pages can be fetched all at once
+            if total_pages > 1:
+                logger.debug(f"GitLab API: Fetching pages 2-{total_pages} of {url} concurrently")
+                pages = await asyncio.gather(
+                    *(
+                        self._get_page(url, params, page)
+                        for page in range(2, total_pages + 1)
+                    )
+                )
+                for data, _, _ in pages:
+                    results.extend(data)
+        else:
+            # GitLab omits the page count for very large listings
+            while next_page:
+                data, _, next_page = await self._get_page(url, params, next_page)
+                results.extend(data)
 
-        return len(merged_mrs)
+        logger.debug(f"GitLab API: Total results: {len(results)}")
+        return results
+
+    async def _get_page(
+        self, url: str, params: dict, page: int
+    ) -> tuple[list[dict], int | None, int | None]:
+        """Fetch one page of a GitLab API listing.
+
+        Args:
+            url: API endpoint URL
+            params: Query parameters
+            page: Page number, starting at 1
+
+        Returns:
+            Tuple of (page items, total number of pages if reported, number
+            of the next page or None on the last page)
+        """
+        params = {**params, "page": page}
+        logger.debug(f"GitLab API: GET {url} (page {page}, params: {params})")
+        response = await self._send_with_retry(
+            self._get_client(), "GET", url, params=params
+        )
+        response.raise_for_status()
+
+        if response.headers.get("X-Total") == "0":
+            logger.debug("GitLab API: No results")
+            return [], None, None
+
+        data = orjson.loads(response.content)
+        logger.debug(f"GitLab API: Received {len(data)} items")
+
+        total_pages = response.headers.get("X-Total-Pages", "")
+        next_page = response.headers.get("X-Next-Page")
+        if next_page is None:
+            # Without pagination headers, only the last page can be short
+            next_page = str(page + 1) if len(data) == params["per_page"] else ""
+
+        return (
+            data,
+            int(total_pages) if total_pages.isdigit() else None,
+            int(next_page) if next_page.isdigit() else None,
+        )
+
+    async def _count_results(self, url: str, params: dict) -> int:
+        """Count the results of a listing without downloading them.
+
+        GitLab reports the number of matches in the X-Total header, so a
+        single one-item page is enough. GitLab omits the header for very
+        large result sets, in which case the listing is fetched in full.
+
+        Args:
+            url: API endpoint URL
+            params: Query parameters
 
-    def _count_commits(
+        Returns:
+            Total number of matching results
+        """
+        count_params = {**params, "per_page": 1}
+        logger.debug(f"GitLab API: GET {url} (count only, params: {count_params})")
+        response = await self._send_with_retry(
+            self._get_client(), "GET", url, params=count_params
+        )
+        response.raise_for_status()
+
+        total = response.headers.get("X-Total", "")
+        if total.isdigit():
+            return int(total)
+
+        logger.debug("GitLab API: No X-Total header, counting full listing")
+        return len(await self._make_request(url, params))
+
+    def _count_by_author(
+        self, items: list[dict], field: str, start_date: datetime, end_date: datetime
+    ) -> Counter[str]:
+        """Count issues or merge requests per author by one of their timestamps.
+
+        A single pass over the project's items serves every tracked user.
+
+        Args:
+            items: Issues or merge requests fetched for the whole project
+            field: Timestamp to check, e.g. "created_at", "closed_at" or
+                "merged_at"
+            start_date: Start of date range
+            end_date: End of date range
+
+        Returns:
+            Number of items whose timestamp is in the date range, keyed by
+            lowercased author username
+        """
+        start_ts = start_date.timestamp()
+        end_ts = end_date.timestamp()
+        return Counter(
+            ((item.get("author") or {}).get("username") or "").lower()
+            for item in items
+            if item.get(field) and start_ts <= _parse_timestamp(item[field]) <= end_ts
+        )
+
+    async def _count_commits(
         self, project_id: str, username: str, start_date: datetime, end_date: datetime
     ) -> int:
         """Count commits for a user in a date range.
@@ -273,122 +608,86 @@ class GitLabClient(ForgeClient):
             "until": end_date.isoformat(),
         }
 
-        commits = self._make_request(url, params)
-        return len(commits)
+        return await self._count_results(url, params)
 
-    def _count_mr_comments(
-        self, project_id: str, username: str, start_date: datetime, end_date: datetime
-    ) -> int:
-        """Count merge request comments for a user in a date range.
+    async def _list_user_events(
+        self,
+        username: str,
+        action: str,
+        target_type: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[dict]:
+        """Fetch a user's events of one kind in a date range.
 
-        Uses the user events API to find comments by the user, then filters
-        to only those in the target project.
+        The events API filters by action and target type on the server, so
+        only the relevant events are downloaded. Its "after" and "before"
+        dates are exclusive, so the window is widened by a day on each side;
+        callers filter on the exact event timestamps.
 
         Args:
-            project_id: URL-encoded project ID
             username: GitLab username
+            action: Event action, e.g. "commented"
+            target_type: Event target type, e.g. "note"
             start_date: Start of date range
             end_date: End of date range
 
         Returns:
-            Number of MR comments
+            List of matching events across all projects
         """
-        # Get user ID first
-        user_id = self._get_user_id(username)
+        user_id = await self._get_user_id(username)
         if not user_id:
-            return 0
+            return []
 
-        # Fetch user events and filter for comment events in this project
         url = f"{self.endpoint}/users/{user_id}/events"
         params = {
-            "after": start_date.date().isoformat(),
-            "before": end_date.date().isoformat(),
-            "action": "commented",
+            "after": (start_date - timedelta(days=1)).date().isoformat(),
+            "before": (end_date + timedelta(days=1)).date().isoformat(),
+            "action": action,
+            "target_type": target_type,
         }
 
-        events = self._make_request(url, params)
+        return await self._make_request(url, params)
 
-        # Decode project_id for comparison
-        target_project = project_id.replace("%2F", "/")
-
-        # Count comments on MRs in this specific project
-        comment_count = 0
-        for event in events:
-            # Check if event is in our target project using path_with_namespace
-            project = event.get("project", {})
-            project_path = project.get("path_with_namespace", "")
-
-            if project_path == target_project:
-                target_type = event.get("target_type")
-                if target_type == "Note":
-                    note = event.get("note", {})
-                    noteable_type = note.get("noteable_type")
-
-                    # Check if it's a MR comment
-                    if noteable_type == "MergeRequest":
-                        created_at = datetime.fromisoformat(
-                            event["created_at"].replace("Z", "+00:00")
-                        )
-                        if start_date <= created_at <= end_date and not note.get("system", False):
-                            comment_count += 1
-
-        return comment_count
-
-    def _count_issue_comments(
-        self, project_id: str, username: str, start_date: datetime, end_date: datetime
+    def _count_comments(
+        self,
+        events: list[dict],
+        repo: str,
+        noteable_type: str,
+        start_date: datetime,
+        end_date: datetime,
     ) -> int:
-        """Count issue comments for a user in a date range.
-
-        Uses the user events API to find comments by the user, then filters
-        to only those in the target project.
+        """Count comments on one kind of item in a project.
 
         Args:
-            project_id: URL-encoded project ID
-            username: GitLab username
+            events: Comment events returned by _list_user_events()
+            repo: Project path in format "group/project"
+            noteable_type: "MergeRequest" or "Issue"
             start_date: Start of date range
             end_date: End of date range
 
         Returns:
-            Number of issue comments
+            Number of non-system comments
         """
-        # Get user ID first
-        user_id = self._get_user_id(username)
-        if not user_id:
-            return 0
-
-        # Fetch user events and filter for comment events in this project
-        url = f"{self.endpoint}/users/{user_id}/events"
-        params = {
-            "after": start_date.date().isoformat(),
-            "before": end_date.date().isoformat(),
-            "action": "commented",
-        }
-
-        events = self._make_request(url, params)
+        start_ts = start_date.timestamp()
+        end_ts = end_date.timestamp()
 
-        # Decode project_id for comparison
-        target_project = project_id.replace("%2F", "/")
-
-        # Count comments on issues in this specific project
         comment_count = 0
         for event in events:
             # Check if event is in our target project using path_with_namespace
             project = event.get("project", {})
-            project_path = project.get("path_with_namespace", "")
-
-            if project_path == target_project:
-                target_type = event.get("target_type")
-                if target_type == "Note":
-                    note = event.get("note", {})
-                    noteable_type = note.get("noteable_type")
-
-                    # Check if it's an issue comment
-                    if noteable_type == "Issue":
-                        created_at = datetime.fromisoformat(
-                            event["created_at"].replace("Z", "+00:00")
-                        )
-                        if start_date <= created_at <= end_date and not note.get("system", False):
-                            comment_count += 1
+            if project.get("path_with_namespace", "") != repo:
+                continue
+
+            if event.get("target_type") != "Note":
+                continue
+
+            note = event.get("note", {})
+            if note.get("noteable_type") != noteable_type or note.get("system", False):
+                continue
+
+            if start_ts <= _parse_timestamp(event["created_at"]) <= end_ts:
+                comment_count += 1
 
         return comment_count
 
@@ -403,6 +702,26 @@ class GitLabClient(ForgeClient):
         Uses GitLab's API to find projects where the specified users
         have activity.
 
+        Args:
+            usernames: List of GitLab usernames to search for
+            start_date: Start of date range
+            end_date: End of date range
+
+        Returns:
+            Set of repository identifiers in "group/project" format
+        """
+        return self._run_sync(
+            self._enumerate_repos_async(usernames, start_date, end_date)
+        )
+
+    async def _enumerate_repos_async(
+        self,
+        usernames: list[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> set[str]:
+        """Enumerate repositories where users have been active.
+
         Args:
             usernames: List of GitLab usernames to search for
             start_date: Start of date range
@@ -415,19 +734,21 @@ class GitLabClient(ForgeClient):
 
         for username in usernames:
             # Get user ID first
-            user_id = self._get_user_id(username)
+            user_id = await self._get_user_id(username)
             if not user_id:
                 continue
 
-            # Get issues created by user
-            repos.update(self._get_user_issues(user_id, start_date, end_date))
-
-            # Get merge requests created by user
-            repos.update(self._get_user_merge_requests(user_id, start_date, end_date))
+            # Get issues and merge requests created by user
+            issue_repos, mr_repos = await asyncio.gather(
+                self._get_user_issues(user_id, start_date, end_date),
+                self._get_user_merge_requests(user_id, start_date, end_date),
+            )
+            repos.update(issue_repos)
+            repos.update(mr_repos)
 
         return repos
 
-    def _get_user_id(self, username: str) -> int | None:
+    async def _get_user_id(self, username: str) -> int | None:
         """Get the user ID for a username.
 
         Args:
@@ -440,7 +761,7 @@ class GitLabClient(ForgeClient):
         params = {"username": username}
 
         try:
-            users = self._make_request(url, params)
+            users = await self._make_request(url, params)
             if users and len(users) > 0:
                 return users[0].get("id")
         except Exception:
@@ -448,7 +769,7 @@ class GitLabClient(ForgeClient):
 
         return None
 
-    def _get_user_issues(
+    async def _get_user_issues(
         self, user_id: int, start_date: datetime, end_date: datetime
     ) -> set[str]:
         """Get projects where user has created issues.
@@ -471,22 +792,18 @@ class GitLabClient(ForgeClient):
         }
 
         try:
-            issues = self._make_request(url, params)
+            issues = await self._make_request(url, params)
             for issue in issues:
-                # Use web_url to extract project path
-                web_url = issue.get("web_url", "")
-                if web_url:
-                    # Extract project path from URL like https://gitlab.com/group/project/-/issues/123
-                    parts = web_url.split("/-/")
-                    if len(parts) >= 2:
-                        project = parts[0].split("/", 3)[-1]  # Get everything after gitlab.com/
-                        repos.add(project)
+                # Full references look like group/project#123
+                reference = issue.get("references", {}).get("full", "")
+                if "#" in reference:
+                    repos.add(reference.rpartition("#")[0])
         except Exception:
             pass
 
         return repos
 
-    def _get_user_merge_requests(
+    async def _get_user_merge_requests(
         self, user_id: int, start_date: datetime, end_date: datetime
     ) -> set[str]:
         """Get projects where user has created merge requests.
@@ -509,16 +826,12 @@ class GitLabClient(ForgeClient):
         }
 
         try:
-            mrs = self._make_request(url, params)
+            mrs = await self._make_request(url, params)
             for mr in mrs:
-                # Use web_url to extract project path
-                web_url = mr.get("web_url", "")
-                if web_url:
-                    # Extract project path from URL like https://gitlab.com/group/project/-/merge_requests/123
-                    parts = web_url.split("/-/")
-                    if len(parts) >= 2:
-                        project = parts[0].split("/", 3)[-1]  # Get everything after gitlab.com/
-                        repos.add(project)
+                # Full references look like group/project!123
+                reference = mr.get("references", {}).get("full", "")
+                if "!" in reference:
+                    repos.add(reference.rpartition("!")[0])
         except Exception:
             pass
 
@@ -1,15 +1,45 @@
 """Pagure API client implementation."""
 
+import asyncio
 import logging
+from collections import Counter
 from datetime import datetime
 
 import httpx
+import orjson
 
+from ..cache import CACHE_DIR, ResponseCache
 from ..forge_client import ForgeClient
 from ..models import RepoStats, UserStats
 
 logger = logging.getLogger(__name__)
 
+# Largest page size Pagure accepts for listings
+_PER_PAGE = 100
+
+# Seconds a cached Pagure response without an ETag or Last-Modified header is
+# reused across runs. Responses with validators are revalidated instead.
+_CACHE_MAX_AGE = 24 * 60 * 60
+
+
+def _nested_get(item: dict, key: str, field: str):
+    """Look up item[key][field] in an API object.
+
+    Unlike chained dict.get() calls with a {} default, no empty dict is
+    allocated for items that lack key, which matters in the filters that
+    run over every listed issue, pull request, commit and comment.
+
+    Args:
+        item: API object, e.g. an issue or a comment
+        key: Key of the nested object, e.g. "project" or "user"
+        field: Key within the nested object, e.g. "fullname" or "name"
+
+    Returns:
+        The nested value, or None if either level is missing
+    """
+    inner = item.get(key)
+    return inner.get(field) if inner else None
+
 
 class PagureClient(ForgeClient):
     """Pagure API client for fetching repository statistics.
@@ -30,6 +60,8 @@ class PagureClient(ForgeClient):
         self.headers = {}
         if self.token:
             self.headers["Authorization"] = f"token {self.token}"
+        self._client: httpx.AsyncClient | None = None
+        self._cache = ResponseCache(CACHE_DIR / "pagure", token=self.token)
 
     def get_forge_name(self) -> str:
         """Return the forge name."""
@@ -44,6 +76,8 @@ class PagureClient(ForgeClient):
     ) -> RepoStats:
         """Fetch statistics for a Pagure repository.
 
+        Synchronous wrapper around get_repo_stats_async().
+
         Args:
             repo: Repository name (may include namespace like "fork/user/repo")
             usernames: List of Pagure usernames to track
@@ -53,41 +87,140 @@ class PagureClient(ForgeClient):
         Returns:
             RepoStats object with all statistics
         """
-        repo_stats = RepoStats(forge="Pagure", repo=repo)
+        return self._run_sync(
+            self.get_repo_stats_async(repo, usernames, start_date, end_date)
+        )
 
-        for username in usernames:
-            user_stats = UserStats(username=username)
+    async def get_repo_stats_async(
+        self,
+        repo: str,
+        usernames: list[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> RepoStats:
+        """Fetch statistics for a Pagure repository.
 
-            user_stats.issues_opened = self._count_issues(
-                repo, username, start_date, end_date, created=True
-            )
-            user_stats.issues_closed = self._count_issues(
-                repo, username, start_date, end_date, created=False
-            )
-            user_stats.prs_opened = self._count_pull_requests(
-                repo, username, start_date, end_date, created=True
-            )
-            user_stats.prs_closed = self._count_pull_requests(
-                repo, username, start_date, end_date, created=False
-            )
-            user_stats.prs_merged = self._count_merged_pull_requests(
-                repo, username, start_date, end_date
-            )
-            user_stats.commits = self._count_commits(repo, username, start_date, end_date)
-            user_stats.pr_comments = self._count_pr_comments(
-                repo, username, start_date, end_date
-            )
-            user_stats.issue_comments = self._count_issue_comments(
-                repo, username, start_date, end_date
-            )
+        Args:
+            repo: Repository name (may include namespace like "fork/user/repo")
+            usernames: List of Pagure usernames to track
+            start_date: Start of date range
+            end_date: End of date range
 
+        Returns:
+            RepoStats object with all statistics
+        """
+        repo_stats = RepoStats(forge="Pagure", repo=repo)
+
+        # Comments are only listed per pull request or issue, not per user,
+        # so fetch them once per repository and partition them locally
+        pr_comments, issue_comments = await asyncio.gather(
+            self._list_pr_comments(repo, start_date, end_date),
+            self._list_issue_comments(repo, start_date, end_date),
+        )
+
+        pr_comment_counts = self._count_comments_by_user(
+            pr_comments, start_date, end_date
+        )
+        issue_comment_counts = self._count_comments_by_user(
+            issue_comments, start_date, end_date
+        )
+
+        # Every user's metrics are independent, so fetch them all at once
+        all_user_stats = await asyncio.gather(
+            *(
+                self._get_user_stats(
+                    repo,
+                    username,
+                    pr_comment_counts,
+                    issue_comment_counts,
+                    start_date,
+                    end_date,
+                )
+                for username in usernames
+            )
+        )
+        for user_stats in all_user_stats:
             repo_stats.add_user_stats(user_stats)
 
         return repo_stats
 
-    def _make_request(self, url: str, params: dict | None = None) -> dict:
+    async def _get_user_stats(
+        self,
+        repo: str,
+        username: str,
+        pr_comments: Counter[str],
+        issue_comments: Counter[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> UserStats:
+        """Fetch all metrics for a single user, issuing the requests concurrently.
+
+        Args:
+            repo: Repository name
+            username: Pagure username
+            pr_comments: Pull request comments of the repository per
+                lowercased username
+            issue_comments: Issue comments of the repository per lowercased
+                username
+            start_date: Start of date range
+            end_date: End of date range
+
+        Returns:
+            UserStats object for the user
+        """
+        (
+            (issues_opened, issues_closed),
+            (prs_opened, prs_closed, prs_merged),
+            commits,
+        ) = await asyncio.gather(
+            self._count_issues(repo, username, start_date, end_date),
+            self._count_pull_requests(repo, username, start_date, end_date),
+            self._count_commits(repo, username, start_date, end_date),
+        )
+
+        return UserStats(
+            username=username,
+            issues_opened=issues_opened,
+            issues_closed=issues_closed,
+            prs_opened=prs_opened,
+            prs_closed=prs_closed,
+            prs_merged=prs_merged,
+            commits=commits,
+            pr_comments=pr_comments[username.lower()],
+            issue_comments=issue_comments[username.lower()],
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        A single client is reused for every request so connections (and
+        their TLS sessions) are pooled and HTTP/2 streams can be multiplexed.
+
+        Returns:
+            Shared async HTTP client
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=30.0,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _make_request(self, url: str, params: dict | None = None) -> dict:
         """Make a request to Pagure API.
 
+        Identical requests are only sent once per client: the repository
+        listings, commit log and pull request or issue details are shared
+        between all users. Callers must not modify the returned data.
+
         Args:
             url: API endpoint URL
             params: Query parameters
@@ -96,108 +229,163 @@ class PagureClient(ForgeClient):
             JSON response as a dictionary
         """
         params = params or {}
+        key = (url, tuple(sorted(params.items())))
+        return await self._coalesce(key, lambda: self._fetch(url, params))
 
-        logger.debug(f"Pagure API: GET {url} (params: {params})")
-        with httpx.Client(headers=self.headers, timeout=30.0) as client:
-            response = client.get(url, params=params)
-            self.api_call_count += 1
-            response.raise_for_status()
-            data = response.json()
-            logger.debug(f"Pagure API: Response received")
-            return data
-
-    def _count_issues(
-        self,
-        repo: str,
-        username: str,
-        start_date: datetime,
-        end_date: datetime,
-        created: bool,
-    ) -> int:
-        """Count issues for a user in a date range.
+    async def _fetch(self, url: str, params: dict) -> dict:
+        """Send a request to Pagure API.
+
+        Responses are cached on disk. If the server sent an ETag or
+        Last-Modified header, the cached entry is revalidated with a
+        conditional request on every run; otherwise it is reused without a
+        request for _CACHE_MAX_AGE seconds. Throttled and transient server
+        errors are retried by _send_with_retry().
 
         Args:
-            repo: Repository name
-            username: Pagure username
-            start_date: Start of date range
-            end_date: End of date range
-            created: If True, count created issues; if False, count closed issues
+            url: API endpoint URL
+            params: Query parameters
 
         Returns:
-            Number of issues
+            JSON response as a dictionary, or an empty dict if the resource
+            does not exist
+
+        Raises:
+            httpx.HTTPStatusError: If the request failed for another reason
         """
-        url = f"{self.endpoint}/user/{username}/issues"
+        cached = await self._cache.aget(url, params)
+        if ResponseCache.is_fresh(cached):
+            logger.debug(f"Pagure API: Using cached response for {url}")
+            return cached["body"]
 
-        # Use created or closed date filter based on what we're counting
-        date_range = f"{start_date.date().isoformat()}..{end_date.date().isoformat()}"
-        params = {
-            "status": "all",
-            "created" if created else "closed": date_range,
-        }
+        logger.debug(f"Pagure API: GET {url} (params: {params})")
+        response = await self._send_with_retry(
+            self._get_client(),
+            "GET",
+            url,
+            params=params,
+            headers=ResponseCache.conditional_headers(cached),
+        )
+
+        if response.status_code == 404:
+            # An unknown user or project has no activity to count
+            logger.debug(f"Pagure API: {url} not found")
+            return {}
+
+        if response.status_code == 304 and cached is not None:
+            # The stored entry and its validators are still current
+            logger.debug("Pagure API: Not modified, using cached response")
+            return cached["body"]
+
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        logger.debug(f"Pagure API: Response received")
+
+        headers = response.headers
+        has_validators = "ETag" in headers or "Last-Modified" in headers
+        await self._cache.aset(
+            url,
+            params,
+            response,
+            data,
+            max_age=None if has_validators else _CACHE_MAX_AGE,
+        )
+        return data
+
+    async def _get_all_pages(
+        self, url: str, params: dict, key: str, pagination_key: str = "pagination"
+    ) -> list[dict]:
+        """Fetch every page of a Pagure listing.
+
+        The first page reports how many pages there are, so the remaining
+        pages are fetched concurrently.
 
-        try:
-            data = self._make_request(url, params)
-            issues = data.get("issues", [])
-
-            # Filter to only issues in the target repository
-            filtered_issues = [
-                i
-                for i in issues
-                if i.get("project", {}).get("fullname", "") == repo
-            ]
+        Args:
+            url: API endpoint URL
+            params: Query parameters
+            key: Response field holding the listed items, e.g. "issues"
+            pagination_key: Response field holding the pagination details of
+                the listed items
 
-            return len(filtered_issues)
-        except Exception:
-            return 0
+        Returns:
+            Items from all pages
+        """
+        params = {**params, "per_page": _PER_PAGE}
+        data = await self._make_request(url, params)
+        items = list(data.get(key, []))
+
+        pages = (data.get(pagination_key) or {}).get("pages") or 1
+        if pages > 1:
+            logger.debug(f"Pagure API: Fetching {pages - 1} more pages of {url}")
+            rest = await asyncio.gather(
+                *(
+                    self._make_request(url, {**params, "page": page})
+                    for page in range(2, pages + 1)
+                )
+            )
+            for page_data in rest:
+                items.extend(page_data.get(key, []))
 
-    def _count_pull_requests(
-        self,
-        repo: str,
-        username: str,
-        start_date: datetime,
-        end_date: datetime,
-        created: bool,
-    ) -> int:
-        """Count pull requests for a user in a date range.
+        return items
+
+    async def _count_issues(
+        self, repo: str, username: str, start_date: datetime, end_date: datetime
+    ) -> tuple[int, int]:
+        """Count issues a user opened and closed in a date range.
+
+        Both counts come from a single pass over the issues the user created;
+        issues merely assigned to them are left out. The listing is only
+        bounded from below by the last update, since an issue opened or
+        closed in the range was updated no earlier than its start, so the
+        same response serves both counts and every repository.
 
         Args:
             repo: Repository name
             username: Pagure username
             start_date: Start of date range
             end_date: End of date range
-            created: If True, count created PRs; if False, count closed PRs
 
         Returns:
-            Number of pull requests
+            Tuple of (issues opened, issues closed)
         """
-        url = f"{self.endpoint}/user/{username}/requests/filed"
-
-        # Use created or closed date filter based on what we're counting
-        date_range = f"{start_date.date().isoformat()}..{end_date.date().isoformat()}"
+        url = f"{self.endpoint}/user/{username}/issues"
         params = {
             "status": "all",
-            "created" if created else "closed": date_range,
+            "assignee": "false",
+            "since": start_date.date().isoformat(),
         }
 
         try:
-            data = self._make_request(url, params)
-            prs = data.get("requests", [])
-
-            # Filter to only PRs in the target repository
-            filtered_prs = [
-                pr
-                for pr in prs
-                if pr.get("project", {}).get("fullname", "") == repo
-            ]
-
-            return len(filtered_prs)
-        except Exception:
-            return 0
-
-    def _count_merged_pull_requests(
+            issues = await self._get_all_pages(
+                url, params, "issues_created", "pagination_issues_created"
+            )
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(f"Pagure API: Could not list issues of {username}: {e}")
+            return 0, 0
+
+        start_ts = start_date.timestamp()
+        end_ts = end_date.timestamp()
+        opened = closed = 0
+        for issue in issues:
+            # Count only issues in the target repository
+            if _nested_get(issue, "project", "fullname") != repo:
+                continue
+            if start_ts <= float(issue.get("date_created") or 0) <= end_ts:
+                opened += 1
+            if start_ts <= float(issue.get("closed_at") or 0) <= end_ts:
+                closed += 1
+
+        return opened, closed
+
+    async def _count_pull_requests(
         self, repo: str, username: str, start_date: datetime, end_date: datetime
-    ) -> int:
-        """Count merged pull requests for a user in a date range.
+    ) -> tuple[int, int, int]:
+        """Count pull requests a user opened, closed and merged in a date range.
+
+        All three counts come from a single pass over the user's filed pull
+        requests. The listing is only bounded from below by the last update,
+        since a pull request opened, closed or merged in the range was
+        updated no earlier than its start, so the same response serves all
+        three counts and every repository.
 
         Args:
             repo: Repository name
@@ -206,35 +394,46 @@ class PagureClient(ForgeClient):
             end_date: End of date range
 
         Returns:
-            Number of merged pull requests
+            Tuple of (pull requests opened, closed, merged)
         """
         url = f"{self.endpoint}/user/{username}/requests/filed"
-        params = {"status": "Merged"}
+        params = {"status": "all", "updated": start_date.date().isoformat()}
 
         try:
-            data = self._make_request(url, params)
-            prs = data.get("requests", [])
-
-            # Filter to only merged PRs in the target repository within date range
-            merged_prs = [
-                pr
-                for pr in prs
-                if pr.get("project", {}).get("fullname", "") == repo
-                and pr.get("date_merged")
-                and start_date.timestamp()
-                <= float(pr["date_merged"])
-                <= end_date.timestamp()
-            ]
-
-            return len(merged_prs)
-        except Exception:
-            return 0
-
-    def _count_commits(
+            prs = await self._get_all_pages(url, params, "requests")
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(
+                f"Pagure API: Could not list pull requests of {username}: {e}"
+            )
+            return 0, 0, 0
+
+        start_ts = start_date.timestamp()
+        end_ts = end_date.timestamp()
+        opened = closed = merged = 0
+        for pr in prs:
+            # Count only PRs in the target repository
+            if _nested_get(pr, "project", "fullname") != repo:
+                continue
+            if start_ts <= float(pr.get("date_created") or 0) <= end_ts:
+                opened += 1
+            # Merged PRs are closed too
+            if start_ts <= float(pr.get("closed_at") or 0) <= end_ts:
+                closed += 1
+            if start_ts <= float(pr.get("date_merged") or 0) <= end_ts:
+                merged += 1
+
+        return opened, closed, merged
+
+    async def _count_commits(
         self, repo: str, username: str, start_date: datetime, end_date: datetime
     ) -> int:
         """Count commits for a user in a date range.
 
+        The git log lists the newest commits first and cannot be bounded on
+        the server, so its pages are fetched one at a time until a page ends
+        with a commit older than the start of the range. Every user walks the
+        same pages, which are only requested once.
+
         Args:
             repo: Repository name
             username: Pagure username
@@ -245,130 +444,161 @@ class PagureClient(ForgeClient):
             Number of commits
         """
         url = f"{self.endpoint}/{repo}/git/log"
-        params = {}
+        start_ts = start_date.timestamp()
+        end_ts = end_date.timestamp()
+        count = 0
+        page = 1
 
         try:
-            data = self._make_request(url, params)
-            commits = data.get("commits", [])
-
-            user_commits = [
-                c
-                for c in commits
-                if c.get("author", {}).get("name") == username
-                and start_date.timestamp()
-                <= float(c.get("commit_time", 0))
-                <= end_date.timestamp()
-            ]
-
-            return len(user_commits)
-        except Exception:
+            while True:
+                data = await self._make_request(
+                    url, {"per_page": _PER_PAGE, "page": page}
+                )
+                commits = data.get("commits", [])
+                count += sum(
+                    1
+                    for c in commits
+                    if _nested_get(c, "author", "name") == username
+                    and start_ts <= float(c.get("commit_time", 0)) <= end_ts
+                )
+
+                pages = (data.get("pagination") or {}).get("pages") or 1
+                if (
+                    not commits
+                    or page >= pages
+                    or float(commits[-1].get("commit_time", 0)) < start_ts
+                ):
+                    return count
+                page += 1
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(f"Pagure API: Could not list commits of {repo}: {e}")
             return 0
 
-    def _count_pr_comments(
-        self, repo: str, username: str, start_date: datetime, end_date: datetime
-    ) -> int:
-        """Count PR comments for a user in a date range.
+    async def _list_pr_comments(
+        self, repo: str, start_date: datetime, end_date: datetime
+    ) -> list[dict]:
+        """Fetch the comments on all pull requests of a repository.
 
-        Uses user-centric API to get PRs in the target repo, then fetches
-        comments only for those PRs to count user's comments.
+        Comments are only returned with each pull request's details, so the
+        details of every pull request created before the end of the date
+        range and updated since its start are fetched. This includes PRs
+        where users may have commented even if they are not the author.
 
         Args:
             repo: Repository name
-            username: Pagure username
             start_date: Start of date range
             end_date: End of date range
 
         Returns:
-            Number of PR comments
+            List of comments across all pull requests
         """
-        # Get all PRs in the target repo within date range
-        # This includes PRs where user may have commented even if not author
         url = f"{self.endpoint}/{repo}/pull-requests"
         params = {"status": "all"}
 
         try:
-            data = self._make_request(url, params)
-            prs = data.get("requests", [])
+            prs = await self._get_all_pages(url, params, "requests")
 
-            # Filter PRs to those active in our date range
+            # Filter PRs to those active in our date range. Commenting
+            # bumps last_updated, so anything last updated before the range
+            # starts has no comments in it and its details are not fetched.
+            start_ts = start_date.timestamp()
+            end_ts = end_date.timestamp()
             date_filtered_prs = [
                 pr
                 for pr in prs
                 if pr.get("date_created")
-                and float(pr.get("date_created", 0)) <= end_date.timestamp()
+                and float(pr["date_created"]) <= end_ts
+                and float(pr.get("last_updated") or end_ts) >= start_ts
             ]
 
-            comment_count = 0
-            for pr in date_filtered_prs:
-                pr_url = f"{self.endpoint}/{repo}/pull-request/{pr['id']}"
-                pr_data = self._make_request(pr_url)
-
-                comments = pr_data.get("comments", [])
-                user_comments = [
-                    c
-                    for c in comments
-                    if c.get("user", {}).get("name") == username
-                    and start_date.timestamp()
-                    <= float(c.get("date_created", 0))
-                    <= end_date.timestamp()
-                ]
-                comment_count += len(user_comments)
-
-            return comment_count
-        except Exception:
-            return 0
+            pr_details = await asyncio.gather(
+                *(
+                    self._make_request(f"{self.endpoint}/{repo}/pull-request/{pr['id']}")
+                    for pr in date_filtered_prs
+                )
+            )
 
-    def _count_issue_comments(
-        self, repo: str, username: str, start_date: datetime, end_date: datetime
-    ) -> int:
-        """Count issue comments for a user in a date range.
+            return [c for pr_data in pr_details for c in pr_data.get("comments", [])]
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(
+                f"Pagure API: Could not list pull request comments of {repo}: {e}"
+            )
+            return []
+
+    async def _list_issue_comments(
+        self, repo: str, start_date: datetime, end_date: datetime
+    ) -> list[dict]:
+        """Fetch the comments on all issues of a repository.
 
-        Gets issues from the target repo, then fetches comments only for
-        those issues to count user's comments.
+        Gets issues from the target repo, then fetches the details of those
+        created before the end of the date range and updated since its start
+        for their comments.
 
         Args:
             repo: Repository name
-            username: Pagure username
             start_date: Start of date range
             end_date: End of date range
 
         Returns:
-            Number of issue comments
+            List of comments across all issues
         """
         url = f"{self.endpoint}/{repo}/issues"
         params = {"status": "all"}
 
         try:
-            data = self._make_request(url, params)
-            issues = data.get("issues", [])
+            issues = await self._get_all_pages(url, params, "issues")
 
-            # Filter issues to those active in our date range
+            # Filter issues to those active in our date range. Commenting
+            # bumps last_updated, so anything last updated before the range
+            # starts has no comments in it and its details are not fetched.
+            start_ts = start_date.timestamp()
+            end_ts = end_date.timestamp()
             date_filtered_issues = [
                 issue
                 for issue in issues
                 if issue.get("date_created")
-                and float(issue.get("date_created", 0)) <= end_date.timestamp()
+                and float(issue["date_created"]) <= end_ts
+                and float(issue.get("last_updated") or end_ts) >= start_ts
             ]
 
-            comment_count = 0
-            for issue in date_filtered_issues:
-                issue_url = f"{self.endpoint}/{repo}/issue/{issue['id']}"
-                issue_data = self._make_request(issue_url)
-
-                comments = issue_data.get("comments", [])
-                user_comments = [
-                    c
-                    for c in comments
-                    if c.get("user", {}).get("name") == username
-                    and start_date.timestamp()
-                    <= float(c.get("date_created", 0))
-                    <= end_date.timestamp()
-                ]
-                comment_count += len(user_comments)
-
-            return comment_count
-        except Exception:
-            return 0
+            issue_details = await asyncio.gather(
+                *(
+                    self._make_request(f"{self.endpoint}/{repo}/issue/{issue['id']}")
+                    for issue in date_filtered_issues
+                )
+            )
+
+            return [
+                c for issue_data in issue_details for c in issue_data.get("comments", [])
+            ]
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(f"Pagure API: Could not list issue comments of {repo}: {e}")
+            return []
+
+    def _count_comments_by_user(
+        self, comments: list[dict], start_date: datetime, end_date: datetime
+    ) -> Counter[str]:
+        """Count comments in a date range per user.
+
+        A single pass over the repository's comments serves every tracked
+        user.
+
+        Args:
+            comments: Comments returned by _list_pr_comments() or
+                _list_issue_comments()
+            start_date: Start of date range
+            end_date: End of date range
+
+        Returns:
+            Number of comments keyed by lowercased username
+        """
+        start_ts = start_date.timestamp()
+        end_ts = end_date.timestamp()
+        return Counter(
+            (_nested_get(c, "user", "name") or "").lower()
+            for c in comments
+            if start_ts <= float(c.get("date_created", 0)) <= end_ts
+        )
 
     def enumerate_repos(
         self,
@@ -389,69 +619,71 @@ class PagureClient(ForgeClient):
         Returns:
             Set of repository identifiers
         """
-        repos = set()
-
-        for username in usernames:
-            # Get user's forked projects
-            repos.update(self._get_user_forks(username))
-
-            # Get user's own projects
-            repos.update(self._get_user_projects(username))
-
-        return repos
+        return self._run_sync(
+            self._enumerate_repos_async(usernames, start_date, end_date)
+        )
 
-    def _get_user_forks(self, username: str) -> set[str]:
-        """Get projects forked by a user.
+    async def _enumerate_repos_async(
+        self,
+        usernames: list[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> set[str]:
+        """Enumerate repositories where users have been active.
 
         Args:
-            username: Pagure username
+            usernames: List of Pagure usernames to search for
+            start_date: Start of date range
+            end_date: End of date range
 
         Returns:
-            Set of project names
+            Set of repository identifiers
         """
         repos = set()
-        url = f"{self.endpoint}/user/{username}"
-
-        try:
-            data = self._make_request(url)
-            user_data = data.get("user", {})
 
-            # Get forked repos
-            forks = user_data.get("forks", [])
-            for fork in forks:
-                repo_name = fork.get("fullname", "")
-                if repo_name:
-                    repos.add(repo_name)
-
-        except Exception:
-            pass
+        # Every user's details are independent, so fetch them all at once.
+        # Forked and owned projects both come from the same user detail.
+        user_details = await asyncio.gather(
+            *(self._get_user_detail(username) for username in usernames)
+        )
+        for user_detail in user_details:
+            repos.update(self._project_names(user_detail, "forks"))
+            repos.update(self._project_names(user_detail, "repos"))
 
         return repos
 
-    def _get_user_projects(self, username: str) -> set[str]:
-        """Get projects owned by a user.
+    async def _get_user_detail(self, username: str) -> dict:
+        """Fetch a user's details, including their forked and owned projects.
 
         Args:
             username: Pagure username
 
         Returns:
-            Set of project names
+            User detail response, or an empty dict if the request failed
         """
-        repos = set()
         url = f"{self.endpoint}/user/{username}"
 
         try:
-            data = self._make_request(url)
-            user_data = data.get("user", {})
+            return await self._make_request(url)
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(f"Pagure API: Could not fetch details of {username}: {e}")
+            return {}
 
-            # Get owned repos
-            projects = user_data.get("repos", [])
-            for project in projects:
-                repo_name = project.get("fullname", "")
-                if repo_name:
-                    repos.add(repo_name)
+    def _project_names(self, user_detail: dict, key: str) -> set[str]:
+        """Extract project names from a user detail response.
 
-        except Exception:
-            pass
+        Pagure lists the projects next to the user's profile; older versions
+        nested them inside it, so both places are checked.
 
-        return repos
+        Args:
+            user_detail: Response returned by _get_user_detail()
+            key: "forks" for forked projects or "repos" for owned projects
+
+        Returns:
+            Set of project names
+        """
+        projects = user_detail.get(key)
+        if projects is None:
+            projects = (user_detail.get("user") or {}).get(key) or []
+
+        return {project["fullname"] for project in projects if project.get("fullname")}
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class UserStats:
     """Statistics for a single user."""
 
@@ -18,8 +18,32 @@ class UserStats:
     pr_comments: int = 0
     issue_comments: int = 0
 
+    def add(self, other: "UserStats") -> None:
+        """Add another set of statistics to these, metric by metric."""
+        self.issues_opened += other.issues_opened
+        self.issues_closed += other.issues_closed
+        self.prs_opened += other.prs_opened
+        self.prs_closed += other.prs_closed
+        self.prs_merged += other.prs_merged
+        self.commits += other.commits
+        self.pr_comments += other.pr_comments
+        self.issue_comments += other.issue_comments
 
-@dataclass
+    def counts(self) -> tuple[int, ...]:
+        """Return the metrics as a tuple, in the order of the dataclass fields."""
+        return (
+            self.issues_opened,
+            self.issues_closed,
+            self.prs_opened,
+            self.prs_closed,
+            self.prs_merged,
+            self.commits,
+            self.pr_comments,
+            self.issue_comments,
+        )
+
+
+@dataclass(slots=True)
 class RepoStats:
     """Statistics for a single repository."""
 
@@ -29,21 +53,14 @@ class RepoStats:
 
     def add_user_stats(self, stats: UserStats) -> None:
         """Add or merge user statistics."""
-        if stats.username in self.user_stats:
-            existing = self.user_stats[stats.username]
-            existing.issues_opened += stats.issues_opened
-            existing.issues_closed += stats.issues_closed
-            existing.prs_opened += stats.prs_opened
-            existing.prs_closed += stats.prs_closed
-            existing.prs_merged += stats.prs_merged
-            existing.commits += stats.commits
-            existing.pr_comments += stats.pr_comments
-            existing.issue_comments += stats.issue_comments
+        existing = self.user_stats.get(stats.username)
+        if existing is not None:
+            existing.add(stats)
         else:
             self.user_stats[stats.username] = stats
 
 
-@dataclass
+@dataclass(slots=True)
 class Report:
     """Complete activity report."""
 
@@ -57,17 +74,9 @@ class Report:
         total_stats = {}
         for repo in self.repos:
             for username, stats in repo.user_stats.items():
-                if username not in total_stats:
-                    total_stats[username] = UserStats(username=username)
-
-                total = total_stats[username]
-                total.issues_opened += stats.issues_opened
-                total.issues_closed += stats.issues_closed
-                total.prs_opened += stats.prs_opened
-                total.prs_closed += stats.prs_closed
-                total.prs_merged += stats.prs_merged
-                total.commits += stats.commits
-                total.pr_comments += stats.pr_comments
-                total.issue_comments += stats.issue_comments
+                total = total_stats.get(username)
+                if total is None:
+                    total = total_stats[username] = UserStats(username=username)
+                total.add(stats)
 
         return total_stats
@@ -1,10 +1,15 @@
 """Markdown report generation."""
 
+import io
 from datetime import datetime
 from pathlib import Path
 
 from .models import Report, RepoStats, UserStats
 
+# One row of the per-repository table: the username followed by the metrics
+# in UserStats.counts() order
+_REPO_ROW = "| {} | {} | {} | {} | {} | {} | {} | {} | {} |\n"
+
 
 def generate_markdown_report(report: Report, output_path: str | Path) -> None:
     """Generate a Markdown report and write it to a file.
@@ -24,142 +29,121 @@ def generate_markdown_report(report: Report, output_path: str | Path) -> None:
 def _build_markdown(report: Report) -> str:
     """Build the complete Markdown content for the report.
 
+    Every section writes straight into one buffer instead of returning
+    lists of lines to be joined.
+
     Args:
         report: Report object containing all statistics
 
     Returns:
         Complete Markdown document as a string
     """
-    lines = []
+    buf = io.StringIO()
 
-    lines.append(f"# Git Activity Report - {report.year}")
-    lines.append("")
-    lines.append(
+    buf.write(f"# Git Activity Report - {report.year}\n\n")
+    buf.write(
         f"**Report Period:** {report.start_date.strftime('%B %d, %Y')} - "
-        f"{report.end_date.strftime('%B %d, %Y')}"
+        f"{report.end_date.strftime('%B %d, %Y')}\n\n"
     )
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    buf.write("---\n\n")
 
-    lines.append("## Overall Summary")
-    lines.append("")
+    buf.write("## Overall Summary\n\n")
     total_stats = report.get_total_stats()
-    lines.extend(_build_summary_table(total_stats))
-    lines.append("")
+    _build_summary_table(buf, total_stats)
+    buf.write("\n")
 
-    lines.append("## Per-User Breakdown")
-    lines.append("")
-    for username in sorted(total_stats.keys()):
+    # Every repository's users are among the total's, so sort them only once
+    usernames = sorted(total_stats.keys())
+
+    buf.write("## Per-User Breakdown\n\n")
+    for username in usernames:
         stats = total_stats[username]
-        lines.append(f"### {username}")
-        lines.append("")
-        lines.extend(_build_user_stats_table(stats))
-        lines.append("")
+        buf.write(f"### {username}\n\n")
+        _build_user_stats_table(buf, stats)
+        buf.write("\n")
 
-    lines.append("## Per-Repository Breakdown")
-    lines.append("")
+    buf.write("## Per-Repository Breakdown\n\n")
     for repo_stats in report.repos:
-        lines.append(f"### {repo_stats.forge} - {repo_stats.repo}")
-        lines.append("")
+        buf.write(f"### {repo_stats.forge} - {repo_stats.repo}\n\n")
         if repo_stats.user_stats:
-            lines.extend(_build_repo_stats_table(repo_stats))
+            _build_repo_stats_table(buf, repo_stats, usernames)
         else:
-            lines.append("*No activity found for tracked users.*")
-        lines.append("")
+            buf.write("*No activity found for tracked users.*\n")
+        buf.write("\n")
 
-    lines.append("---")
-    lines.append("")
-    lines.append(
+    buf.write("---\n\n")
+    buf.write(
         f"*Report generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}*"
     )
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def _build_summary_table(total_stats: dict[str, UserStats]) -> list[str]:
-    """Build a summary statistics table.
+def _build_summary_table(buf: io.StringIO, total_stats: dict[str, UserStats]) -> None:
+    """Write a summary statistics table.
 
     Args:
+        buf: Buffer the Markdown table is written to
         total_stats: Dictionary of username to UserStats
-
-    Returns:
-        List of Markdown table lines
     """
-    lines = []
-    lines.append("| Metric | Total |")
-    lines.append("|--------|-------|")
-
-    total_issues_opened = sum(s.issues_opened for s in total_stats.values())
-    total_issues_closed = sum(s.issues_closed for s in total_stats.values())
-    total_prs_opened = sum(s.prs_opened for s in total_stats.values())
-    total_prs_closed = sum(s.prs_closed for s in total_stats.values())
-    total_prs_merged = sum(s.prs_merged for s in total_stats.values())
-    total_commits = sum(s.commits for s in total_stats.values())
-    total_pr_comments = sum(s.pr_comments for s in total_stats.values())
-    total_issue_comments = sum(s.issue_comments for s in total_stats.values())
-
-    lines.append(f"| Issues Opened | {total_issues_opened} |")
-    lines.append(f"| Issues Closed | {total_issues_closed} |")
-    lines.append(f"| PRs Opened | {total_prs_opened} |")
-    lines.append(f"| PRs Closed | {total_prs_closed} |")
-    lines.append(f"| PRs Merged | {total_prs_merged} |")
-    lines.append(f"| Commits | {total_commits} |")
-    lines.append(f"| PR Comments | {total_pr_comments} |")
-    lines.append(f"| Issue Comments | {total_issue_comments} |")
-
-    return lines
-
-
-def _build_user_stats_table(stats: UserStats) -> list[str]:
-    """Build a statistics table for a single user.
+    buf.write("| Metric | Total |\n")
+    buf.write("|--------|-------|\n")
 
-    Args:
-        stats: UserStats object
+    totals = UserStats(username="")
+    for stats in total_stats.values():
+        totals.add(stats)
 
-    Returns:
-        List of Markdown table lines
-    """
-    lines = []
-    lines.append("| Metric | Count |")
-    lines.append("|--------|-------|")
-    lines.append(f"| Issues Opened | {stats.issues_opened} |")
-    lines.append(f"| Issues Closed | {stats.issues_closed} |")
-    lines.append(f"| PRs Opened | {stats.prs_opened} |")
-    lines.append(f"| PRs Closed | {stats.prs_closed} |")
-    lines.append(f"| PRs Merged | {stats.prs_merged} |")
-    lines.append(f"| Commits | {stats.commits} |")
-    lines.append(f"| PR Comments | {stats.pr_comments} |")
-    lines.append(f"| Issue Comments | {stats.issue_comments} |")
+    buf.write(f"| Issues Opened | {totals.issues_opened} |\n")
+    buf.write(f"| Issues Closed | {totals.issues_closed} |\n")
+    buf.write(f"| PRs Opened | {totals.prs_opened} |\n")
+    buf.write(f"| PRs Closed | {totals.prs_closed} |\n")
+    buf.write(f"| PRs Merged | {totals.prs_merged} |\n")
+    buf.write(f"| Commits | {totals.commits} |\n")
+    buf.write(f"| PR Comments | {totals.pr_comments} |\n")
+    buf.write(f"| Issue Comments | {totals.issue_comments} |\n")
 
-    return lines
 
+def _build_user_stats_table(buf: io.StringIO, stats: UserStats) -> None:
+    """Write a statistics table for a single user.
 
-def _build_repo_stats_table(repo_stats: RepoStats) -> list[str]:
-    """Build a statistics table for a repository.
+    Args:
+        buf: Buffer the Markdown table is written to
+        stats: UserStats object
+    """
+    buf.write("| Metric | Count |\n")
+    buf.write("|--------|-------|\n")
+    buf.write(f"| Issues Opened | {stats.issues_opened} |\n")
+    buf.write(f"| Issues Closed | {stats.issues_closed} |\n")
+    buf.write(f"| PRs Opened | {stats.prs_opened} |\n")
+    buf.write(f"| PRs Closed | {stats.prs_closed} |\n")
+    buf.write(f"| PRs Merged | {stats.prs_merged} |\n")
+    buf.write(f"| Commits | {stats.commits} |\n")
+    buf.write(f"| PR Comments | {stats.pr_comments} |\n")
+    buf.write(f"| Issue Comments | {stats.issue_comments} |\n")
+
+
+def _build_repo_stats_table(
+    buf: io.StringIO, repo_stats: RepoStats, usernames: list[str]
+) -> None:
+    """Write a statistics table for a repository.
 
     Args:
+        buf: Buffer the Markdown table is written to
         repo_stats: RepoStats object
-
-    Returns:
-        List of Markdown table lines
+        usernames: Sorted usernames of the whole report, a superset of the
+            repository's users
     """
-    lines = []
-    lines.append(
+    buf.write(
         "| User | Issues Opened | Issues Closed | PRs Opened | PRs Closed | "
-        "PRs Merged | Commits | PR Comments | Issue Comments |"
+        "PRs Merged | Commits | PR Comments | Issue Comments |\n"
     )
-    lines.append(
+    buf.write(
         "|------|---------------|---------------|------------|------------|"
-        "------------|---------|-------------|----------------|"
+        "------------|---------|-------------|----------------|\n"
     )
 
-    for username in sorted(repo_stats.user_stats.keys()):
-        stats = repo_stats.user_stats[username]
-        lines.append(
-            f"| {username} | {stats.issues_opened} | {stats.issues_closed} | "
-            f"{stats.prs_opened} | {stats.prs_closed} | {stats.prs_merged} | "
-            f"{stats.commits} | {stats.pr_comments} | {stats.issue_comments} |"
-        )
-
-    return lines
+    user_stats = repo_stats.user_stats
+    for username in usernames:
+        stats = user_stats.get(username)
+        if stats is not None:
+            buf.write(_REPO_ROW.format(username, *stats.counts()))
@@ -0,0 +1,97 @@
+"""Tests for the GitLab forge client."""
+
+import re
+import unittest
+from collections import Counter
+from datetime import datetime, timezone
+
+from git_year_end_report.forges.gitlab import GitLabClient
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+END = datetime(2025, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+
+
+class GraphQLCountQueryTest(unittest.IsolatedAsyncioTestCase):
+    """Shape of the aliased GraphQL count query."""
+
+    async def asyncSetUp(self):
+        self.client = GitLabClient(token="token")
+        self.queries = []
+
+        async def graphql(query, variables):
+            self.queries.append((query, variables))
+            aliases = re.findall(r"(u\d+_\w+): ", query)
+            return {"project": {alias: {"count": 1} for alias in aliases}}
+
+        self.client._graphql = graphql
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def test_query_counts_each_user_by_date_filter(self):
+        counts = await self.client._count_batch_graphql(
+            "group/project", ["alice", "bob"], START, END
+        )
+
+        self.assertEqual(len(self.queries), 1)
+        query, variables = self.queries[0]
+        self.assertIn("project(fullPath: $path)", query)
+        self.assertEqual(variables["u0"], "alice")
+        self.assertEqual(variables["u1"], "bob")
+        for index in range(2):
+            self.assertIn(
+                f"u{index}_issues_opened: issues(authorUsername: $u{index}, "
+                "createdAfter: $start, createdBefore: $end) { count }",
+                query,
+            )
+            self.assertIn(
+                f"u{index}_issues_closed: issues(authorUsername: $u{index}, "
+                "closedAfter: $start, closedBefore: $end) { count }",
+                query,
+            )
+            self.assertIn(
+                f"u{index}_prs_opened: mergeRequests(authorUsername: $u{index}, "
+                "createdAfter: $start, createdBefore: $end) { count }",
+                query,
+            )
+            self.assertIn(
+                f"u{index}_prs_merged: mergeRequests(authorUsername: $u{index}, "
+                "mergedAfter: $start, mergedBefore: $end) { count }",
+                query,
+            )
+        self.assertEqual(
+            set(counts), {"issues_opened", "issues_closed", "prs_opened", "prs_merged"}
+        )
+        self.assertEqual(counts["prs_opened"], Counter({"alice": 1, "bob": 1}))
+
+    async def test_merge_requests_are_not_filtered_by_close_date(self):
+        await self.client._count_batch_graphql("group/project", ["alice"], START, END)
+
+        query, _ = self.queries[0]
+        self.assertNotIn("prs_closed", query)
+        for selection in re.findall(r"mergeRequests\([^)]*\)", query):
+            self.assertNotIn("closedAfter", selection)
+            self.assertNotIn("closedBefore", selection)
+
+
+class CountByAuthorTest(unittest.TestCase):
+    """Per-author counts from the REST issue and merge request lists."""
+
+    def test_usernames_match_case_insensitively(self):
+        client = GitLabClient()
+        items = [
+            {"author": {"username": "Alice"}, "closed_at": "2025-03-01T00:00:00Z"},
+            {"author": {"username": "alice"}, "closed_at": "2025-04-01T00:00:00Z"},
+            {"author": {"username": "ALICE"}, "closed_at": "2024-04-01T00:00:00Z"},
+            {"author": None, "closed_at": "2025-04-01T00:00:00Z"},
+            {"author": {"username": "bob"}, "closed_at": None},
+        ]
+
+        counts = client._count_by_author(items, "closed_at", START, END)
+
+        self.assertEqual(counts["alice"], 2)
+        self.assertEqual(counts["bob"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()